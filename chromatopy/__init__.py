@@ -1,5 +1,28 @@
-import os
+import importlib
+from typing import TYPE_CHECKING
 
-from .tools.analyzer import ChromAnalyzer
-from .tools.molecule import Molecule
+from .tools import configure_logging as configure_logging
 from .units.predefined import C, K, celsius, hour, kelvin, minute, second
+
+if TYPE_CHECKING:
+    from .tools.analyzer import ChromAnalyzer
+    from .tools.molecule import Molecule
+
+# Public classes, imported from their modules on first access
+_LAZY_ATTRS = {
+    "ChromAnalyzer": ".tools.analyzer",
+    "Molecule": ".tools.molecule",
+}
+
+
+def __getattr__(name: str) -> object:
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
@@ -561,15 +561,19 @@ def get_measured_once(
     Returns:
         set[str]: Set containing the molecule IDs that are assigned to a peak at least once.
     """
+    wanted = set(molecule_ids)
+    measured: set[str] = set()
+    for measurement in measurements:
+        for chrom in measurement.chromatograms:
+            measured.update(
+                peak.molecule_id for peak in chrom.peaks if peak.molecule_id in wanted
+            )
 
-    # Initialize the dictionary with False for each molecule ID
-    return {
-        peak.molecule_id
-        for measurement in measurements
-        for chrom in measurement.chromatograms
-        for peak in chrom.peaks
-        if peak.molecule_id is not None
-    }
+        # the remaining measurements can not add any molecule
+        if len(measured) == len(wanted):
+            break
+
+    return measured
 
 
 def _check_molecule_conc_unit_and_init_conc(molecule: Molecule):
@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import re
 from abc import abstractmethod
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
 from loguru import logger
 from pydantic import BaseModel, Field, field_validator, model_validator
@@ -11,6 +13,19 @@ from pydantic import BaseModel, Field, field_validator, model_validator
 from chromatopy.model import DataType, Measurement, UnitDefinition
 from chromatopy.units import C
 
+T = TypeVar("T")
+_VALID_MODES = frozenset({DataType.CALIBRATION.value, DataType.TIMECOURSE.value})
+
+# patterns to extract reaction times or concentrations and their units from file names
+_VALUE_PATTERNS = {
+    DataType.TIMECOURSE.value: re.compile(
+        r".*?(\d+(\.\d+)?)\s*[_-]?\s*(min|minutes?|sec|seconds?|hours?).*"
+    ),
+    DataType.CALIBRATION.value: re.compile(
+        r".*?(\d+(\.\d+)?)\s*[_-]?\s*(mM|µM|uM|nM|mol|mmol|umol|nmol).*"
+    ),
+}
+
 
 class MetadataExtractionError(Exception):
     def __init__(self, message, suggestion=None):
@@ -47,6 +62,7 @@ class AbstractReader(BaseModel):
         temperature_unit (UnitDefinition): Unit of the temperature.
         silent (bool): If True, suppresses output messages.
         file_paths (List[str]): List of file paths to process.
+        n_workers (Optional[int]): Number of threads used to load the files.
     """
 
     dirpath: str = Field(
@@ -87,10 +103,16 @@ class AbstractReader(BaseModel):
         default_factory=list, description="List of file paths to process."
     )
 
+    n_workers: int | None = Field(
+        default=None,
+        ge=1,
+        description="Number of threads used to load the files. Files are loaded sequentially if not set.",
+    )
+
     @field_validator("mode", mode="before")
     def validate_mode(cls, value):
         value = value.lower()
-        if value not in {DataType.CALIBRATION.value, DataType.TIMECOURSE.value}:
+        if value not in _VALID_MODES:
             raise ValueError("Invalid mode. Must be 'calibration' or 'timecourse'.")
         return value
 
@@ -177,15 +199,9 @@ class AbstractReader(BaseModel):
             # Get all filenames of normal files in the directory, exclude hidden files
             filenames = [f for f in path.iterdir() if not f.name.startswith(".")]
 
-        # Define patterns based on the mode
-        if mode == DataType.TIMECOURSE.value:
-            # Pattern to extract reaction times and units
-            pattern = r".*?(\d+(\.\d+)?)\s*[_-]?\s*(min|minutes?|sec|seconds?|hours?).*"
-        elif mode == DataType.CALIBRATION.value:
-            # Pattern to extract concentrations and units
-            pattern = r".*?(\d+(\.\d+)?)\s*[_-]?\s*(mM|µM|uM|nM|mol|mmol|umol|nmol).*"
-
-        else:
+        # Select the pattern based on the mode
+        pattern = _VALUE_PATTERNS.get(mode)
+        if pattern is None:
             raise ValueError("Invalid mode.")
 
         # Extract data and units from filenames
@@ -193,9 +209,9 @@ class AbstractReader(BaseModel):
         units = []
 
         for file in filenames:
-            match_obj = re.search(pattern, file.name)
+            match_obj = pattern.search(file.name)
             if not match_obj:
-                match_obj = re.search(pattern, file.parent.name)
+                match_obj = pattern.search(file.parent.name)
             if match_obj:
                 value = float(match_obj.group(1))
                 unit_str = match_obj.group(3)
@@ -288,6 +304,15 @@ class AbstractReader(BaseModel):
         """Abstract method that must be implemented by subclasses."""
         pass
 
+    def _load_files(self, loader: Callable[[str], T], file_paths: list[str]) -> list[T]:
+        """Applies the loader to each file path, using a thread pool if `n_workers`
+        is greater than one. The results keep the order of the file paths."""
+        if self.n_workers is None or self.n_workers == 1 or len(file_paths) < 2:
+            return [loader(path) for path in file_paths]
+
+        with ThreadPoolExecutor(max_workers=self.n_workers) as executor:
+            return list(executor.map(loader, file_paths))
+
     def print_success(self, n_measurement_objects: int) -> None:
         """Prints a success message."""
         print(f" Loaded {n_measurement_objects} chromatograms.")
@@ -22,8 +22,8 @@ class AgilentCSVReader(AbstractReader):
         """
 
         measurements = []
-        for path_idx, csv_path in enumerate(self.file_paths):
-            peaks = self._read_peaks_from_csv(csv_path)
+        peak_lists = self._load_files(self._read_peaks_from_csv, self.file_paths)
+        for path_idx, peaks in enumerate(peak_lists):
             chromatogram = Chromatogram(peaks=peaks)
 
             data = Data(
@@ -8,9 +8,8 @@ from chromatopy.readers.abstractreader import AbstractReader
 class AgilentRDLReader(AbstractReader):
     def read(self):
         measurements = []
-        for path_id, path in enumerate(self.file_paths):
-            lines = self.read_file(path)
-
+        file_lines = self._load_files(self.read_file, self.file_paths)
+        for path_id, lines in enumerate(file_lines):
             peak_data, sample_name, signal = self.extract_information(lines)
 
             peak_data = [
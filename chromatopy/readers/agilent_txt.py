@@ -28,8 +28,8 @@ class AgilentTXTReader(AbstractReader):
         'Report.TXT' files {len(self.file_paths)}.
         """
         measurements = []
-        for file, reaction_time in zip(self.file_paths, self.values):
-            file_content = self._read_file(file)
+        file_contents = self._load_files(self._read_file, self.file_paths)
+        for file_content, reaction_time in zip(file_contents, self.values):
             measurement = self._parse_measurement(
                 file_content, reaction_time, self.unit
             )
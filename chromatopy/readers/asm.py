@@ -1,7 +1,7 @@
-import json
 from pathlib import Path
 from typing import Any
 
+import orjson
 from loguru import logger
 
 from chromatopy.model import Chromatogram, Data, Measurement, Peak
@@ -24,8 +24,9 @@ class ASMReader(AbstractReader):
         """
 
         measurements = []
-        for i, file in enumerate(sorted(self.file_paths)):
-            content = self._read_asm_file(file)
+        file_paths = sorted(self.file_paths)
+        contents = self._load_files(self._read_asm_file, file_paths)
+        for i, (file, content) in enumerate(zip(file_paths, contents)):
             measurement = self._map_measurement(content, self.values[i], file)
             measurements.append(measurement)
 
@@ -60,10 +61,7 @@ class ASMReader(AbstractReader):
         self.file_paths = sorted(files)
 
     def _read_asm_file(self, file_path: str) -> dict:
-        with open(file_path, "r") as file:
-            content = json.load(file)
-
-        return content
+        return orjson.loads(Path(file_path).read_bytes())
 
     def _map_measurement(
         self,
@@ -248,35 +246,38 @@ class ASMReader(AbstractReader):
 
         if "peak width at half height" in peak_dict:
             width = peak_dict["peak width at half height"]
+            width_value = width["value"]
             if width["unit"] == "s":
-                width["value"] /= 60
+                width_value /= 60
             elif width["unit"] == "min":
                 pass
             else:
                 raise ValueError(f"Unit '{width['unit']}' not recognized")
-            width_value = width["value"]
         else:
             width_value = None
 
         retention_time = peak_dict["retention time"]
+        retention_time_value = retention_time["value"]
         if retention_time["unit"] == "s":
-            retention_time["value"] /= 60
+            retention_time_value /= 60
         elif retention_time["unit"] == "min":
             pass
         else:
             raise ValueError(f"Unit '{retention_time['unit']}' not recognized")
 
         peak_start = peak_dict["peak start"]
+        peak_start_value = peak_start["value"]
         if peak_start["unit"] == "s":
-            peak_start["value"] /= 60
+            peak_start_value /= 60
         elif peak_start["unit"] == "min":
             pass
         else:
             raise ValueError(f"Unit '{peak_start['unit']}' not recognized")
 
         peak_end = peak_dict["peak end"]
+        peak_end_value = peak_end["value"]
         if peak_end["unit"] == "s":
-            peak_end["value"] /= 60
+            peak_end_value /= 60
         elif peak_end["unit"] == "min":
             pass
         else:
@@ -290,14 +291,14 @@ class ASMReader(AbstractReader):
             asym_factor = None
 
         return Peak(
-            retention_time=peak_dict["retention time"]["value"],
+            retention_time=retention_time_value,
             area=peak_area,
             amplitude=peak_dict["peak height"]["value"],
             width=width_value,
             skew=asym_factor,
             percent_area=peak_dict["relative peak area"]["value"],
-            peak_start=peak_dict["peak start"]["value"],
-            peak_end=peak_dict["peak end"]["value"],
+            peak_start=peak_start_value,
+            peak_end=peak_end_value,
         )
 
 
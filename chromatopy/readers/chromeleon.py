@@ -26,8 +26,8 @@ class ChromeleonReader(AbstractReader):
         """
 
         measurements = []
-        for file_id, file in enumerate(self.file_paths):
-            content = self._read_chromeleon_file(file)
+        contents = self._load_files(self._read_chromeleon_file, self.file_paths)
+        for file_id, content in enumerate(contents):
             measurement = self._map_measurement(
                 content, self.values[file_id], self.unit
             )
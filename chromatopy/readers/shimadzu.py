@@ -12,6 +12,13 @@ from chromatopy.units.predefined import ul
 
 class ShimadzuReader(AbstractReader):
     SECTION_PATTERN: ClassVar[re.Pattern] = re.compile(r"\[(.*)\]")
+    CHROMATOGRAM_PATTERN: ClassVar[re.Pattern] = re.compile(r"(?=R\.Time)")
+    PEAK_TABLE_PATTERN: ClassVar[re.Pattern] = re.compile(r"(?=Peak#)")
+    DECIMAL_COMMA_PATTERN: ClassVar[re.Pattern] = re.compile(r"(\b\d+),(\d+\b)")
+    DECIMAL_DELIMITER_PATTERN: ClassVar[re.Pattern] = re.compile(r"(\d),(\d{3}\b)")
+    DETECTOR_INFO_PATTERN: ClassVar[re.Pattern] = re.compile(
+        r"^(.*?)\t(.*)$", re.MULTILINE
+    )
 
     def model_post_init(self, __context: Any) -> None:
         if not self.file_paths:
@@ -30,8 +37,9 @@ class ShimadzuReader(AbstractReader):
             raise ValueError("No files found. Is the directory empty?")
 
         measurements = []
-        for i, file in enumerate(sorted(self.file_paths)):
-            content = self.open_file(file)
+        file_paths = sorted(self.file_paths)
+        contents = self._load_files(self.open_file, file_paths)
+        for i, (file, content) in enumerate(zip(file_paths, contents)):
             sections = self.create_sections(content)
             self._get_available_detectors(sections)
 
@@ -88,7 +96,7 @@ class ShimadzuReader(AbstractReader):
 
                     # Extract measurement data
                     if "Chromatogram" in section_key:
-                        meta_section, section = re.split(r"(?=R\.Time)", section)
+                        meta_section, section = self.CHROMATOGRAM_PATTERN.split(section)
 
                         chromatogram_meta = self.get_section_dict(meta_section)
 
@@ -121,8 +129,7 @@ class ShimadzuReader(AbstractReader):
 
         if not header.count(",") == data[0].count(","):
             data = "\n".join(data)
-            pattern = r"(\b\d+),(\d+\b)"
-            data = re.sub(pattern, r"\1.\2", data)
+            data = self.DECIMAL_COMMA_PATTERN.sub(r"\1.\2", data)
         else:
             data = "\n".join(data)
 
@@ -131,12 +138,22 @@ class ShimadzuReader(AbstractReader):
         return table
 
     def open_file(self, path: str) -> str:
-        """Read the content of a file as a string."""
+        """Read the content of a file as a string. Files are decoded as UTF-8,
+        otherwise with the Windows code page LabSolutions exports in and, for bytes
+        undefined in that code page, as Latin-1."""
 
-        try:
-            return Path(path).read_text(encoding="ISO-8859-1")
-        except UnicodeDecodeError:
-            raise IOError(f"Could not read file {path}")
+        content = Path(path).read_bytes()
+        for encoding in ("utf-8", "cp1252"):
+            try:
+                text = content.decode(encoding)
+                break
+            except UnicodeDecodeError:
+                continue
+        else:
+            text = content.decode("latin-1")
+
+        # universal newlines, as when reading in text mode
+        return text.replace("\r\n", "\n").replace("\r", "\n")
 
     def create_sections(self, file_content: str) -> dict:
         """Parse a Shimadzu ASCII-export file into sections."""
@@ -176,8 +193,7 @@ class ShimadzuReader(AbstractReader):
 
         except pd.errors.ParserError:
             try:
-                pattern = r"(\b\d+),(\d+\b)"
-                section = re.sub(pattern, r"\1.\2", section)
+                section = self.DECIMAL_COMMA_PATTERN.sub(r"\1.\2", section)
 
                 meta_table = (
                     pd.read_table(
@@ -195,9 +211,7 @@ class ShimadzuReader(AbstractReader):
                 return preprocess_to_dict(section)
 
     def preprocess_decimal_delimiters(self, data_str):
-        pattern = r"(\d),(\d{3}\b)"
-
-        return re.sub(pattern, r"\1.\2", data_str)
+        return self.DECIMAL_DELIMITER_PATTERN.sub(r"\1.\2", data_str)
 
     def _map_peak_table(self, table: pd.DataFrame) -> dict:
         try:
@@ -219,7 +233,7 @@ class ShimadzuReader(AbstractReader):
 
     def add_peaks(self, section: str) -> dict:
         try:
-            meta, section = re.split(r"(?=Peak#)", section)
+            meta, section = self.PEAK_TABLE_PATTERN.split(section)
         except ValueError:
             return {}  # No peaks in the section
 
@@ -282,10 +296,8 @@ class ShimadzuReader(AbstractReader):
         """Parse the metadata in a section using regex."""
         config_dict = {}
 
-        # Regex pattern to match lines like 'Key<TAB>Value(s)'
-        pattern = re.compile(r"^(.*?)\t(.*)$", re.MULTILINE)
-
-        matches = pattern.findall(section.strip())
+        # lines like 'Key<TAB>Value(s)'
+        matches = self.DETECTOR_INFO_PATTERN.findall(section.strip())
 
         for key, values_str in matches:
             # Split values by tab and strip whitespace
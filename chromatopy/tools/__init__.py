@@ -0,0 +1,12 @@
+import sys
+
+from loguru import logger
+
+
+def configure_logging(level: str = "INFO") -> None:
+    """Replaces all loguru handlers with a stderr handler of the given level, for
+    instance to hide the debug messages of chromatopy. Meant to be called by
+    applications, the library itself does not configure any handlers."""
+    logger.enable("chromatopy")
+    logger.remove()
+    logger.add(sys.stderr, level=level)
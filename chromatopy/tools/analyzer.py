@@ -1,35 +1,40 @@
 from __future__ import annotations
 
-import copy
-import json
 import multiprocessing as mp
+import os
 import time
 from pathlib import Path
-from typing import Literal, Optional
+from typing import TYPE_CHECKING, Literal, Optional
 
 import numpy as np
-import plotly.colors as pc
-import plotly.graph_objects as go
-import scipy
-import scipy.stats
-from calipytion.model import Standard
-from calipytion.tools.utility import pubchem_request_molecule_name
 from loguru import logger
 from pydantic import BaseModel, Field, field_validator
-from pyenzyme import EnzymeMLDocument
-from rich.progress import Progress
 
 from chromatopy.model import (
     Chromatogram,
-    DataType,
     Measurement,
     UnitDefinition,
 )
+from chromatopy.readers.abstractreader import _VALID_MODES
 from chromatopy.tools.molecule import Molecule, Protein
-from chromatopy.tools.peak_utils import SpectrumProcessor
-from chromatopy.tools.utility import _resolve_chromatogram
+from chromatopy.tools.utility import (
+    measurements_peak_index,
+    pubchem_molecule_name,
+    pubchem_molecule_names,
+    retention_windows,
+)
 from chromatopy.units import C
 
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+    from calipytion.model import Standard
+    from pyenzyme import EnzymeMLDocument
+
+    from chromatopy.tools.peak_utils import SpectrumProcessor
+
+# Plotted signals with more points are drawn as WebGL instead of SVG traces
+_WEBGL_MIN_POINTS = 5000
+
 
 class ChromAnalyzer(BaseModel):
     id: str = Field(
@@ -67,7 +72,7 @@ class ChromAnalyzer(BaseModel):
     @field_validator("mode", mode="before")
     def validate_mode(cls, value):
         value = value.lower()
-        if value not in {DataType.CALIBRATION.value, DataType.TIMECOURSE.value}:
+        if value not in _VALID_MODES:
             raise ValueError("Invalid mode. Must be 'calibration' or 'timecourse'.")
         return value
 
@@ -110,7 +115,7 @@ class ChromAnalyzer(BaseModel):
                 in minutes. Defaults to None.
         """
 
-        new_mol = copy.deepcopy(molecule)
+        new_mol = molecule.model_copy(deep=True)
 
         if init_conc is not None:
             new_mol.init_conc = init_conc
@@ -170,7 +175,7 @@ class ChromAnalyzer(BaseModel):
             ), "Concentration unit must be provided if initial concentration is given."
 
         if name is None:
-            name = pubchem_request_molecule_name(pubchem_cid)
+            name = pubchem_molecule_name(pubchem_cid)
 
         molecule = Molecule(
             id=id,
@@ -188,6 +193,35 @@ class ChromAnalyzer(BaseModel):
 
         return molecule
 
+    def define_molecules(self, molecules: list[dict]) -> list[Molecule]:
+        """Defines and adds multiple molecules to the list of molecules. Names
+        that are not provided are fetched from the PubChem database in batched
+        requests.
+
+        Args:
+            molecules (list[dict]): Keyword arguments of `define_molecule` for each molecule.
+
+        Returns:
+            list[Molecule]: The molecule objects that were added to the list of species.
+        """
+        missing_cids = [
+            spec["pubchem_cid"] for spec in molecules if spec.get("name") is None
+        ]
+        names: dict[int, str] = {}
+        if missing_cids:
+            try:
+                names = pubchem_molecule_names(missing_cids)
+            except ValueError as e:
+                logger.warning(f"Batched PubChem lookup failed: {e}")
+
+        # molecules without a batched name fall back to the single lookup
+        return [
+            self.define_molecule(
+                **{**spec, "name": spec.get("name") or names.get(spec["pubchem_cid"])}
+            )
+            for spec in molecules
+        ]
+
     def define_internal_standard(
         self,
         id: str,
@@ -254,23 +288,66 @@ class ChromAnalyzer(BaseModel):
             ret_tolerance (float): Retention time tolerance for peak annotation in minutes.
             wavelength (float | None): Wavelength of the detector on which the molecule was detected.
         """
-        assigned_peak_count = 0
+        # the peaks of all measurements are searched at once
+        rts, peaks = measurements_peak_index(self.measurements, wavelength)
+        (window,) = retention_windows(
+            rts, np.array([molecule.retention_time]), np.array([ret_tolerance])
+        )
 
-        for meas in self.measurements:
-            for peak in _resolve_chromatogram(meas.chromatograms, wavelength).peaks:
-                if (
-                    peak.retention_time - ret_tolerance
-                    < molecule.retention_time
-                    < peak.retention_time + ret_tolerance
-                ):
-                    peak.molecule_id = molecule.id
-                    assigned_peak_count += 1
-                    logger.debug(
-                        f"{molecule.id} assigned as molecule ID for peak at {peak.retention_time}."
-                    )
+        for idx in window:
+            peak = peaks[idx]
+            peak.molecule_id = molecule.id
+            # formatted by loguru only if a sink accepts debug messages
+            logger.debug(
+                "{} assigned as molecule ID for peak at {}.",
+                molecule.id,
+                peak.retention_time,
+            )
+        assigned_peak_count = len(window)
 
         print(f"🎯 Assigned {molecule.name} to {assigned_peak_count} peaks")
 
+    def _register_molecules_peaks(self, molecules: list[Molecule]):
+        """Registers the peaks of multiple molecules based on their retention time
+        tolerance and wavelength. The windows of all molecules on the same wavelength
+        are located in one vectorized search. For peaks in overlapping windows, the
+        molecule registered last takes precedence.
+
+        Args:
+            molecules (list[Molecule]): The molecules for which the peaks should be registered.
+        """
+        by_wavelength: dict[float | None, list[Molecule]] = {}
+        for molecule in molecules:
+            if molecule.has_retention_time:
+                by_wavelength.setdefault(molecule.wavelength, []).append(molecule)
+
+        windows: dict[int, tuple[list, np.ndarray]] = {}
+        for wavelength, group in by_wavelength.items():
+            rts, peaks = measurements_peak_index(self.measurements, wavelength)
+            centers = np.array([molecule.retention_time for molecule in group])
+            tolerances = np.array([molecule.retention_tolerance for molecule in group])
+            for molecule, window in zip(
+                group, retention_windows(rts, centers, tolerances)
+            ):
+                windows[id(molecule)] = (peaks, window)
+
+        # peaks are assigned in molecule order, as with one call per molecule
+        for molecule in molecules:
+            if id(molecule) not in windows:
+                continue
+
+            peaks, window = windows[id(molecule)]
+            for idx in window:
+                peak = peaks[idx]
+                peak.molecule_id = molecule.id
+                logger.debug(
+                    "{} assigned as molecule ID for peak at {}.",
+                    molecule.id,
+                    peak.retention_time,
+                )
+
+            print(f"🎯 Assigned {molecule.name} to {len(window)} peaks")
+
     def define_protein(
         self,
         id: str,
@@ -321,7 +398,7 @@ class ChromAnalyzer(BaseModel):
             protein (Protein): The protein object to be added.
         """
 
-        nu_prot = copy.deepcopy(protein)
+        nu_prot = protein.model_copy(deep=True)
 
         if init_conc:
             nu_prot.init_conc = init_conc
@@ -344,6 +421,7 @@ class ChromAnalyzer(BaseModel):
         id: str | None = None,
         name: str = "Chromatographic measurement",
         silent: bool = False,
+        n_workers: int | None = None,
     ) -> ChromAnalyzer:
         """Reads chromatographic data from a directory containing Allotrope Simple Model (ASM) json files.
         Measurements are assumed to be named alphabetically, allowing sorting by file name.
@@ -363,6 +441,8 @@ class ChromAnalyzer(BaseModel):
             id (str, optional): Unique identifier of the ChromAnalyzer object. If not provided, the `path` is used as ID.
             name (str, optional): Name of the measurement. Defaults to "Chromatographic measurement".
             silent (bool, optional): If True, no success message is printed. Defaults to False.
+            n_workers (int | None, optional): Number of threads used to load the files. If not provided,
+                the files are loaded sequentially. Defaults to None.
 
         Returns:
             ChromAnalyzer: ChromAnalyzer object containing the measurements.
@@ -378,6 +458,7 @@ class ChromAnalyzer(BaseModel):
             "temperature_unit": temperature_unit,
             "silent": silent,
             "mode": mode,
+            "n_workers": n_workers,
         }
 
         reader = ASMReader(**data)
@@ -401,6 +482,7 @@ class ChromAnalyzer(BaseModel):
         id: str | None = None,
         name: str = "Chromatographic measurement",
         silent: bool = False,
+        n_workers: int | None = None,
     ) -> ChromAnalyzer:
         """Reads chromatographic data from a directory containing Shimadzu files.
         Measurements are assumed to be named alphabetically, allowing sorting by file name.
@@ -420,6 +502,8 @@ class ChromAnalyzer(BaseModel):
             id (str, optional): Unique identifier of the ChromAnalyzer object. If not provided, the `path` is used as ID.
             name (str, optional): Name of the measurement. Defaults to "Chromatographic measurement".
             silent (bool, optional): If True, no success message is printed. Defaults to False.
+            n_workers (int | None, optional): Number of threads used to load the files. If not provided,
+                the files are loaded sequentially. Defaults to None.
 
         Returns:
             ChromAnalyzer: ChromAnalyzer object containing the measurements.
@@ -435,6 +519,7 @@ class ChromAnalyzer(BaseModel):
             "temperature_unit": temperature_unit,
             "silent": silent,
             "mode": mode,
+            "n_workers": n_workers,
         }
 
         reader = ShimadzuReader(**data)
@@ -463,6 +548,7 @@ class ChromAnalyzer(BaseModel):
         id: str | None = None,
         name: str = "Chromatographic measurement",
         silent: bool = False,
+        n_workers: int | None = None,
     ) -> ChromAnalyzer:
         """Reads Agilent `Report.txt` or `RESULTS.csv` files within a `*.D` directories within the specified path.
 
@@ -481,6 +567,8 @@ class ChromAnalyzer(BaseModel):
             id (str, optional): Unique identifier of the ChromAnalyzer object. If not provided, the `path` is used as ID.
             name (str, optional): Name of the measurement. Defaults to "Chromatographic measurement".
             silent (bool, optional): If True, no success message is printed. Defaults to False.
+            n_workers (int | None, optional): Number of threads used to load the files. If not provided,
+                the files are loaded sequentially. Defaults to None.
 
         Returns:
             ChromAnalyzer: ChromAnalyzer object containing the measurements.
@@ -491,35 +579,33 @@ class ChromAnalyzer(BaseModel):
 
         directory = Path(path)
 
+        # reports are located in the sample directories right below the path
         txt_paths = []
         csv_paths = []
+        for sample_dir in directory.iterdir():
+            if not sample_dir.is_dir():
+                continue
+            for file in sample_dir.iterdir():
+                if file.name == "Report.TXT":
+                    txt_paths.append(str(file.absolute()))
+                elif file.name == "RESULTS.CSV":
+                    csv_paths.append(str(file.absolute()))
+
+        # RDL reports start with a box drawing frame, only the head of the
+        # first txt file is read and the walk continues only for RDL reports
+        all_txt_paths = (
+            str((Path(root) / file).absolute())
+            for root, _, files in os.walk(directory)
+            for file in files
+            if file.endswith(".txt")
+        )
+        first_txt_path = next(all_txt_paths, None)
         rdl_paths = []
-
-        txt_paths = [
-            str(f.absolute())
-            for f in directory.rglob("Report.TXT")
-            if f.parent.parent == directory
-        ]
-        csv_paths = [
-            str(f.absolute())
-            for f in directory.rglob("RESULTS.CSV")
-            if f.parent.parent == directory
-        ]
-        rdl_paths = []
-
-        try:
-            txt_path = next(directory.rglob("*.txt"))
-            try:
-                lines = AgilentRDLReader.read_file(str(txt_path))
-                if lines[0].startswith("┌─────"):
-                    rdl_paths = [str(f.absolute()) for f in directory.rglob("*.txt")]
-                else:
-                    txt_paths = txt_paths
-            except UnicodeDecodeError:
-                txt_paths = txt_paths
-
-        except StopIteration:
-            txt_paths = txt_paths
+        if first_txt_path is not None:
+            rdl_marker = "┌─────".encode()
+            with open(first_txt_path, "rb") as file:
+                if file.read(len(rdl_marker)) == rdl_marker:
+                    rdl_paths = [first_txt_path, *all_txt_paths]
 
         data = {
             "dirpath": path,
@@ -530,6 +616,7 @@ class ChromAnalyzer(BaseModel):
             "temperature_unit": temperature_unit,
             "silent": silent,
             "mode": mode,
+            "n_workers": n_workers,
         }
 
         if rdl_paths:
@@ -543,7 +630,7 @@ class ChromAnalyzer(BaseModel):
         elif csv_paths and not txt_paths:
             data["file_paths"] = csv_paths  # type: ignore
             reader = AgilentCSVReader(**data)  # type: ignore
-            measurements = AgilentCSVReader(**data).read()  # type: ignore
+            measurements = reader.read()  # type: ignore
         else:
             raise IOError(f"No 'REPORT.TXT' or 'RESULTS.CSV' files found in '{path}'.")
 
@@ -565,6 +652,7 @@ class ChromAnalyzer(BaseModel):
         id: str | None = None,
         name: str = "Chromatographic measurement",
         silent: bool = False,
+        n_workers: int | None = None,
     ) -> ChromAnalyzer:
         """Reads Chromeleon txt files from a directory. The files in the directory are assumed to be of
         one calibration or timecourse measurement series.
@@ -584,6 +672,8 @@ class ChromAnalyzer(BaseModel):
             id (str, optional): Unique identifier of the ChromAnalyzer object. If not provided, the `path` is used as ID.
             name (str, optional): Name of the measurement. Defaults to "Chromatographic measurement".
             silent (bool, optional): If True, no success message is printed. Defaults to False.
+            n_workers (int | None, optional): Number of threads used to load the files. If not provided,
+                the files are loaded sequentially. Defaults to None.
 
         Returns:
             ChromAnalyzer: ChromAnalyzer object containing the measurements.
@@ -599,6 +689,7 @@ class ChromAnalyzer(BaseModel):
             "temperature_unit": temperature_unit,
             "silent": silent,
             "mode": mode,
+            "n_workers": n_workers,
         }
 
         if id is None:
@@ -622,9 +713,23 @@ class ChromAnalyzer(BaseModel):
         path = Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Serialize the instance to JSON, allowing overwriting
-        with open(path, "w") as file:
-            file.write(self.model_dump_json(indent=2))
+        # Serialize everything but the measurements, which are streamed into
+        # the placeholder one by one to keep the memory footprint small
+        skeleton = self.model_copy(update={"measurements": []})
+        skeleton_json = skeleton.__pydantic_serializer__.to_json(skeleton, indent=2)
+        head, tail = skeleton_json.split(b'\n  "measurements": []', 1)
+
+        # Serialize the instance to JSON bytes, allowing overwriting
+        with open(path, "wb") as file:
+            file.write(head)
+            file.write(b'\n  "measurements": [')
+            for meas_idx, meas in enumerate(self.measurements):
+                if meas_idx:
+                    file.write(b",")
+                meas_json = meas.__pydantic_serializer__.to_json(meas, indent=2)
+                file.write(b"\n    " + meas_json.replace(b"\n", b"\n    "))
+            file.write(b"\n  ]" if self.measurements else b"]")
+            file.write(tail)
 
     @classmethod
     def from_json(cls, path):
@@ -639,14 +744,10 @@ class ChromAnalyzer(BaseModel):
 
         Raises:
             FileNotFoundError: If the specified file does not exist.
-            json.JSONDecodeError: If the file contains invalid JSON.
+            pydantic.ValidationError: If the file contains invalid JSON.
         """
-        # Load from a JSON file
-        with open(path, "r") as file:
-            data = json.load(file)
-
-        # Return an instance of the class
-        return cls(**data)
+        # Validate the raw JSON directly, without building an intermediate dict
+        return cls.model_validate_json(Path(path).read_bytes())
 
     def to_enzymeml(
         self,
@@ -712,9 +813,8 @@ class ChromAnalyzer(BaseModel):
             if molecule.id == molecule_id:
                 return molecule
 
-            if self.internal_standard:
-                if self.internal_standard.id == molecule_id:
-                    return self.internal_standard
+        if self.internal_standard and self.internal_standard.id == molecule_id:
+            return self.internal_standard
 
         raise ValueError(f"Molecule with ID {molecule_id} not found.")
 
@@ -753,6 +853,9 @@ class ChromAnalyzer(BaseModel):
             hplc_py_kwargs: Keyword arguments to be passed to the `fit_peaks` method of the
                 `hplc-py` library. For more information, visit the [HPLC-Py Documentation](https://cremerlab.github.io/hplc-py/quant.html#hplc.quant.Chromatogram.fit_peaks).
         """
+        from rich.progress import Progress
+
+        from chromatopy.tools.peak_utils import SpectrumProcessor
 
         hplc_py_kwargs["prominence"] = prominence
         hplc_py_kwargs["approx_peak_width"] = 0.6
@@ -760,9 +863,10 @@ class ChromAnalyzer(BaseModel):
 
         for meas in self.measurements:
             for chrom in meas.chromatograms:
+                chrom_times = np.asarray(chrom.times)
                 if min_retention_time is not None:
                     # get index of first retention time greater than min_retention_time
-                    idx_min = int(np.argmax(np.array(chrom.times) > min_retention_time))
+                    idx_min = int(np.argmax(chrom_times > min_retention_time))
                     times = chrom.times[idx_min:]
                     signals = chrom.signals[idx_min:]
                 else:
@@ -772,7 +876,7 @@ class ChromAnalyzer(BaseModel):
 
                 if max_retention_time is not None:
                     # filter out retention times greater than max_retention_time
-                    idx_max = int(np.argmax(np.array(times) > max_retention_time))
+                    idx_max = int(np.argmax(chrom_times[idx_min:] > max_retention_time))
                     times = times[:idx_max]
                     signals = signals[:idx_max]
                 else:
@@ -839,10 +943,7 @@ class ChromAnalyzer(BaseModel):
                 chrom.peaks = results[processor_idx].peaks
                 processor_idx += 1
 
-        for molecule in self.molecules:
-            self._register_peaks(
-                molecule, molecule.retention_tolerance, molecule.wavelength
-            )
+        self._register_molecules_peaks(self.molecules)
 
         if no_peaks:
             print(
@@ -850,21 +951,32 @@ class ChromAnalyzer(BaseModel):
             )
 
     def visualize_all(
-        self, assigned_only: bool = False, dark_mode: bool = False, show: bool = False
+        self,
+        assigned_only: bool = False,
+        dark_mode: bool = False,
+        show: bool = False,
+        max_points: int | None = 2000,
     ) -> go.Figure:
         """Plots the fitted peaks of the chromatograms in an interactive figure.
 
         Args:
             assigned_only (bool, optional): If True, only the peaks that are assigned to a molecule are plotted. Defaults to False.
             dark_mode (bool, optional): If True, the figure is displayed in dark mode. Defaults to False.
+            max_points (int | None, optional): Signals with more points are downsampled to this number of points
+                for plotting. If None, all points are plotted. Defaults to 2000.
 
         Returns:
             go.Figure: _description_
         """
         # make plotly figure for each chromatogram whereas ech chromatogram contains multiple traces and each comatogram is mapped to one slider
+        import plotly.graph_objects as go
         from plotly.express.colors import sample_colorscale
 
-        from chromatopy.tools.utility import generate_gaussian_data, generate_visibility
+        from chromatopy.tools.utility import (
+            build_visibility_index,
+            generate_peak_curves,
+            lttb_indices,
+        )
 
         if dark_mode:
             theme = "plotly_dark"
@@ -875,132 +987,160 @@ class ChromAnalyzer(BaseModel):
 
         peak_vis_mode = None
 
-        fig = go.Figure()
+        # traces are collected as dicts and validated once by the figure
+        traces = []
+        # molecule names are resolved once per molecule instead of once per peak
+        peak_names: dict[str, str] = {}
+        # chromatograms with the same number of peaks share their colors
+        color_maps: dict[int, list[str]] = {1: ["teal"]}
 
-        for meas in self.measurements:
-            for chrom in meas.chromatograms[:1]:
-                # model peaks as gaussians
-                if chrom.peaks:
-                    peaks_exist = True
-                    if len(chrom.peaks) == 1:
-                        color_map = ["teal"]
-                    else:
-                        color_map = sample_colorscale("viridis", len(chrom.peaks))
+        # the first chromatogram of each measurement is plotted
+        entries = [
+            (meas, meas.chromatograms[0])
+            for meas in self.measurements
+            if meas.chromatograms
+        ]
 
-                    for color, peak in zip(color_map, chrom.peaks):
-                        if assigned_only and not peak.molecule_id:
-                            continue
+        for meas, chrom in entries:
+            # all traces of a chromatogram are matched to its slider step by this
+            hover_text = f"{meas.id}"
+
+            # model peaks as gaussians
+            if chrom.peaks:
+                peaks_exist = True
+                n_peaks = len(chrom.peaks)
+                color_map = color_maps.get(n_peaks)
+                if color_map is None:
+                    color_map = sample_colorscale("viridis", n_peaks)
+                    color_maps[n_peaks] = color_map
+
+                plotted = [
+                    (color, peak)
+                    for color, peak in zip(color_map, chrom.peaks)
+                    if peak.molecule_id or not assigned_only
+                ]
+                # the curves of all plotted peaks are evaluated in one batch
+                curves = generate_peak_curves([peak for _, peak in plotted])
 
-                        if peak.molecule_id:
+                for (color, peak), curve in zip(plotted, curves):
+                    if peak.molecule_id:
+                        peak_name = peak_names.get(peak.molecule_id)
+                        if peak_name is None:
                             peak_name = self.get_molecule(peak.molecule_id).name
-                        else:
-                            peak_name = f"Peak {peak.retention_time:.2f}"
-
-                        if peak.peak_start and peak.peak_end and peak.width:
-                            x_arr, data = generate_gaussian_data(
-                                amplitude=peak.amplitude,
-                                center=peak.retention_time,
-                                half_height_diameter=peak.width,
-                                start=peak.peak_start,
-                                end=peak.peak_end,
-                            )
-                            peak_vis_mode = "gaussian"
-
-                        elif peak.skew and peak.width:
-                            x_start = peak.retention_time - 3 * peak.width
-                            x_end = peak.retention_time + 3 * peak.width
-                            x_arr = np.linspace(x_start, x_end, 100)
-                            data = (
-                                scipy.stats.skewnorm.pdf(
-                                    x_arr,
-                                    peak.skew if peak.skew else 0,
-                                    loc=peak.retention_time,
-                                    scale=peak.width,
-                                )
-                                * peak.amplitude
-                            )
-                            peak_vis_mode = "skewnorm"
-
-                        else:
-                            # make only h-line at retention time
-                            interval = 0.03
-                            left_shifted = peak.retention_time - interval
-                            right_shifted = peak.retention_time + interval
-                            x_arr = [
-                                left_shifted,
-                                right_shifted,
-                                right_shifted,
-                                left_shifted,
-                                left_shifted,
-                            ]
-                            data = [0, 0, peak.amplitude, peak.amplitude, 0]
-
-                        custom1 = [round(peak.area)] * len(x_arr)
-                        custom2 = [round(peak.retention_time, 2)] * len(x_arr)
-                        customdata = np.stack((custom1, custom2), axis=-1)
-                        fig.add_trace(
-                            go.Scatter(
-                                visible=False,
-                                x=x_arr,
-                                y=data,
-                                mode="lines",
-                                name=peak_name,
-                                customdata=customdata,
-                                hovertemplate="<b>Area:</b> %{customdata[0]}<br>"
-                                + "<b>Center:</b> %{customdata[1]}<br>"
-                                + "<extra></extra>",
-                                hovertext=f"{meas.id}",
-                                line=dict(
-                                    color=color,
-                                    width=1,
-                                ),
-                                fill="tozeroy",
-                                fillcolor=color,
-                            )
-                        )
+                            peak_names[peak.molecule_id] = peak_name
+                    else:
+                        peak_name = f"Peak {peak.retention_time:.2f}"
 
-                else:
-                    peaks_exist = False
-
-                if chrom.times and chrom.signals:
-                    signal_exist = True
-                    fig.add_trace(
-                        go.Scatter(
-                            visible=False,
-                            x=chrom.times,
-                            y=chrom.signals,
-                            mode="lines",
-                            name="Signal",
-                            hovertext=f"{meas.id}",
-                            line=dict(
-                                color=signal_color,
-                                dash="solid",
-                                width=1,
-                            ),
-                        )
+                    if curve is not None:
+                        x_arr, data, peak_vis_mode = curve
+                    else:
+                        # make only h-line at retention time
+                        interval = 0.03
+                        left_shifted = peak.retention_time - interval
+                        right_shifted = peak.retention_time + interval
+                        x_arr = [
+                            left_shifted,
+                            right_shifted,
+                            right_shifted,
+                            left_shifted,
+                            left_shifted,
+                        ]
+                        data = [0, 0, peak.amplitude, peak.amplitude, 0]
+
+                    traces.append(
+                        {
+                            "type": "scatter",
+                            "visible": False,
+                            "x": x_arr,
+                            "y": data,
+                            "mode": "lines",
+                            "name": peak_name,
+                            # area and center are the same for every point of a peak
+                            "meta": [round(peak.area), round(peak.retention_time, 2)],
+                            "hovertemplate": "<b>Area:</b> %{meta[0]}<br>"
+                            + "<b>Center:</b> %{meta[1]}<br>"
+                            + "<extra></extra>",
+                            "hovertext": hover_text,
+                            "line": {
+                                "color": color,
+                                "width": 1,
+                            },
+                            "fill": "tozeroy",
+                            "fillcolor": color,
+                        }
                     )
-                else:
-                    signal_exist = False
-
-                if chrom.processed_signal and chrom.times:
-                    processed_signal_exist = True
-                    fig.add_trace(
-                        go.Scatter(
-                            visible=False,
-                            x=chrom.times,
-                            y=chrom.processed_signal,
-                            mode="lines",
-                            name="Processed Signal",
-                            hovertext=f"{meas.id}",
-                            line=dict(
-                                color="red",
-                                dash="dot",
-                                width=2,
-                            ),
-                        )
+
+            else:
+                peaks_exist = False
+
+            x_signal, y_signal = chrom.times, chrom.signals
+            x_processed, y_processed = chrom.times, chrom.processed_signal
+            if (
+                max_points
+                and chrom.times
+                and chrom.signals
+                and len(chrom.times) > max_points
+            ):
+                # the processed signal is reduced to the points kept of the signal
+                times = np.asarray(chrom.times, dtype=np.float64)
+                signals = np.asarray(chrom.signals, dtype=np.float64)
+                keep = lttb_indices(times, signals, max_points)
+                x_signal = times[keep]
+                y_signal = signals[keep]
+                if chrom.processed_signal:
+                    processed_signal = np.asarray(
+                        chrom.processed_signal, dtype=np.float64
                     )
-                else:
-                    processed_signal_exist = False
+                    keep = keep[keep < len(processed_signal)]
+                    x_processed = times[keep]
+                    y_processed = processed_signal[keep]
+
+            if chrom.times and len(x_signal) > _WEBGL_MIN_POINTS:
+                signal_trace_type = "scattergl"
+            else:
+                signal_trace_type = "scatter"
+
+            if chrom.times and chrom.signals:
+                signal_exist = True
+                traces.append(
+                    {
+                        "type": signal_trace_type,
+                        "visible": False,
+                        "x": x_signal,
+                        "y": y_signal,
+                        "mode": "lines",
+                        "name": "Signal",
+                        "hovertext": hover_text,
+                        "line": {
+                            "color": signal_color,
+                            "dash": "solid",
+                            "width": 1,
+                        },
+                    }
+                )
+            else:
+                signal_exist = False
+
+            if chrom.processed_signal and chrom.times:
+                processed_signal_exist = True
+                traces.append(
+                    {
+                        "type": signal_trace_type,
+                        "visible": False,
+                        "x": x_processed,
+                        "y": y_processed,
+                        "mode": "lines",
+                        "name": "Processed Signal",
+                        "hovertext": hover_text,
+                        "line": {
+                            "color": "red",
+                            "dash": "dot",
+                            "width": 2,
+                        },
+                    }
+                )
+            else:
+                processed_signal_exist = False
 
         if assigned_only:
             n_peaks_in_first_chrom = len(
@@ -1019,15 +1159,21 @@ class ChromAnalyzer(BaseModel):
             )
 
         if signal_exist and not processed_signal_exist:
-            fig.data[n_peaks_in_first_chrom].visible = True
+            traces[n_peaks_in_first_chrom]["visible"] = True
         elif signal_exist and processed_signal_exist:
-            fig.data[n_peaks_in_first_chrom].visible = True
-            fig.data[n_peaks_in_first_chrom + 1].visible = True
+            traces[n_peaks_in_first_chrom]["visible"] = True
+            traces[n_peaks_in_first_chrom + 1]["visible"] = True
 
         if peaks_exist:
             for i in range(n_peaks_in_first_chrom):
-                fig.data[i].visible = True
+                traces[i]["visible"] = True
+
+        fig = go.Figure(data=traces)
 
+        # masks stay arrays, plotly copies arrays in one piece instead of
+        # deep-copying a list of booleans per step
+        visibility_index = build_visibility_index(fig)
+        hidden = np.zeros(len(fig.data), dtype=bool)
         steps = []
         for meas in self.measurements:
             for chrom in meas.chromatograms:
@@ -1036,7 +1182,7 @@ class ChromAnalyzer(BaseModel):
                     "method": "update",
                     "args": [
                         {
-                            "visible": generate_visibility(meas.id, fig),
+                            "visible": visibility_index.get(meas.id, hidden),
                         }
                     ],
                 }
@@ -1075,15 +1221,13 @@ class ChromAnalyzer(BaseModel):
             wavelength (float | None, optional): The wavelength of the detector. Defaults to None.
             visualize (bool, optional): If True, the standard curve is visualized. Defaults to True.
         """
-        assert any(
-            [molecule in [mol for mol in self.molecules]]
+        assert (
+            molecule in self.molecules
         ), "Molecule not found in molecules of analyzer."
 
         # check if all measurements only contain one chromatogram
-        if all([len(meas.chromatograms) == 1 for meas in self.measurements]):
-            chroms = [
-                chrom for meas in self.measurements for chrom in meas.chromatograms
-            ]
+        if all(len(meas.chromatograms) == 1 for meas in self.measurements):
+            chroms = [meas.chromatograms[0] for meas in self.measurements]
         else:
             assert (
                 wavelength is not None
@@ -1096,7 +1240,10 @@ class ChromAnalyzer(BaseModel):
             ), "No chromatograms found at the specified wavelength."
 
         peak_areas = [
-            peak.area for chrom in chroms for peak in chrom.peaks if peak.molecule_id
+            peak.area
+            for chrom in chroms
+            for peak in chrom.peaks
+            if peak.molecule_id == molecule.id
         ]
 
         concs = [meas.data.value for meas in self.measurements]
@@ -1157,7 +1304,6 @@ class ChromAnalyzer(BaseModel):
         for idx, mol in enumerate(self.molecules):
             if mol.id == molecule.id:
                 self.molecules[idx] = molecule
-                assert self.molecules[idx] is molecule
                 return
 
         self.molecules.append(molecule)
@@ -1173,36 +1319,64 @@ class ChromAnalyzer(BaseModel):
 
         self.proteins.append(protein)
 
-    def visualize_spectra(self, dark_mode: bool = False) -> go.Figure:
+    def visualize_spectra(
+        self, dark_mode: bool = False, max_points: int | None = 2000
+    ) -> go.Figure:
         """
         Plots all chromatograms in the ChromAnalyzer in a single plot.
 
         Args:
             dark_mode (bool, optional): If True, the figure is displayed in dark mode. Defaults to False.
+            max_points (int | None, optional): Signals with more points are downsampled to this number of points
+                for plotting. If None, all points are plotted. Defaults to 2000.
 
         Returns:
             go.Figure: The plotly figure object.
         """
+        import plotly.colors as pc
+        import plotly.graph_objects as go
+
+        from chromatopy.tools.utility import lttb_indices
 
         if dark_mode:
             theme = "plotly_dark"
         else:
             theme = "plotly_white"
 
-        fig = go.Figure()
+        traces = []
 
         color_map = pc.sample_colorscale("viridis", len(self.measurements))
         for meas, color in zip(self.measurements, color_map):
             for chrom in meas.chromatograms[:1]:
-                fig.add_trace(
-                    go.Scatter(
-                        x=chrom.times,
-                        y=chrom.signals,
-                        name=meas.id,
-                        line=dict(width=2, color=color),
-                    )
+                x_signal, y_signal = chrom.times, chrom.signals
+                if (
+                    max_points
+                    and chrom.times
+                    and chrom.signals
+                    and len(chrom.times) > max_points
+                ):
+                    times = np.asarray(chrom.times, dtype=np.float64)
+                    signals = np.asarray(chrom.signals, dtype=np.float64)
+                    keep = lttb_indices(times, signals, max_points)
+                    x_signal = times[keep]
+                    y_signal = signals[keep]
+
+                if chrom.times and len(x_signal) > _WEBGL_MIN_POINTS:
+                    trace_type = "scattergl"
+                else:
+                    trace_type = "scatter"
+                traces.append(
+                    {
+                        "type": trace_type,
+                        "x": x_signal,
+                        "y": y_signal,
+                        "name": meas.id,
+                        "line": {"width": 2, "color": color},
+                    }
                 )
 
+        fig = go.Figure(data=traces)
+
         if chrom.wavelength:
             wave_string = f"({chrom.wavelength} nm)"
         else:
@@ -19,9 +19,6 @@ from pydantic import BaseModel
 
 from chromatopy.model import Peak
 
-logger.remove()
-logger.add(sys.stderr, level="INFO")
-
 
 class SpectrumProcessor(BaseModel):
     time: list[float]
@@ -89,27 +86,31 @@ class SpectrumProcessor(BaseModel):
                     "No peaks found in the chromatogram. Halving the prominence and trying again."
                 )
                 hplc_py_kwargs["prominence"] /= 2
-                self.fit(**hplc_py_kwargs)
+                return self.fit(**hplc_py_kwargs)
+
+        fitted_peaks = getattr(fitter, "peaks", None)
+        if fitted_peaks is None or len(fitted_peaks) == 0:
+            self.peaks = []
+            self.processed_signal = []
+            return self
 
         self.processed_signal = np.sum(fitter.unmixed_chromatograms, axis=1).tolist()
 
-        peaks = []
-        for record in fitter.peaks.to_dict(orient="records"):
-            peaks.append(
-                Peak(
-                    retention_time=record["retention_time"],
-                    area=record["area"],
-                    amplitude=record["amplitude"],
-                    skew=record["skew"],
-                    width=record["scale"],
-                    # max_signal=record["signal_maximum"],
-                )
+        # values originate from the fitter, so validation is skipped
+        make_peak = Peak.model_construct
+        peaks = [
+            make_peak(
+                retention_time=float(record["retention_time"]),
+                area=float(record["area"]),
+                amplitude=float(record["amplitude"]),
+                skew=float(record["skew"]),
+                width=float(record["scale"]),
+                # max_signal=record["signal_maximum"],
             )
+            for record in fitted_peaks.to_dict(orient="records")
+        ]
 
-        if len(peaks) > 0:
-            peaks = sorted(peaks, key=lambda x: x.retention_time)
-
-        self.peaks = peaks
+        self.peaks = sorted(peaks, key=lambda x: x.retention_time)
 
         return self
 
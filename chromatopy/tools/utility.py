@@ -1,15 +1,99 @@
-import sys
+from __future__ import annotations
 
+import itertools
+import math
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+import httpx
 import numpy as np
-import plotly.graph_objects as go
-from loguru import logger
-from matplotlib import pyplot as plt
-from pyenzyme import DataTypes, EnzymeMLDocument
 
-from chromatopy.model import Chromatogram, UnitDefinition
+from chromatopy.model import Chromatogram, Measurement, Peak, UnitDefinition
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+    from pyenzyme import EnzymeMLDocument
+
+# Normalization constant of the standard normal density
+_INV_SQRT_2PI: float = 1.0 / math.sqrt(2.0 * math.pi)
+
+# Conversion factor from the full width at half maximum to sigma of a Gaussian
+_FWHM_TO_SIGMA: float = 1.0 / (2.0 * math.sqrt(2.0 * math.log(2.0)))
+
+_UNIT_TABLE: dict[tuple[str, float], str] = {
+    ("second", 1.0): "s",
+    ("second", 60.0): "min",
+    ("second", 3600.0): "h",
+}
+
+_CONC_SCALE: dict[float, str] = {
+    1: "M",
+    -1: "M",
+    -3: "mM",
+    -6: "µM",
+    -9: "nM",
+    -12: "pM",
+}
+
+# Maximum number of CIDs per PubChem request
+_PUBCHEM_BATCH_SIZE = 200
+
+
+@lru_cache(maxsize=4096)
+def pubchem_molecule_name(pubchem_cid: int) -> str:
+    """Retrieves the name of a molecule from PubChem. Successful lookups are
+    cached for the lifetime of the process.
+
+    Args:
+        pubchem_cid (int): PubChem CID of the molecule.
+
+    Returns:
+        str: The name of the molecule.
+    """
+    from calipytion.tools.utility import pubchem_request_molecule_name
+
+    return pubchem_request_molecule_name(pubchem_cid)
+
+
+def pubchem_molecule_names(pubchem_cids: list[int]) -> dict[int, str]:
+    """Retrieves the names of multiple molecules from PubChem, requesting up to
+    200 CIDs at once. CIDs for which PubChem returns no name are missing from
+    the result.
+
+    Args:
+        pubchem_cids (list[int]): PubChem CIDs of the molecules.
+
+    Returns:
+        dict[int, str]: Molecule names by PubChem CID.
+
+    Raises:
+        ValueError: If a request fails or its response has an unexpected structure.
+    """
+    unique_cids = list(dict.fromkeys(pubchem_cids))
+    names: dict[int, str] = {}
+
+    for start in range(0, len(unique_cids), _PUBCHEM_BATCH_SIZE):
+        batch = ",".join(
+            str(cid) for cid in unique_cids[start : start + _PUBCHEM_BATCH_SIZE]
+        )
+        url = f"https://pubchem.ncbi.nlm.nih.gov/rest/pug/compound/cid/{batch}/property/Title/JSON"
 
-logger.remove()
-logger.add(sys.stderr, level="INFO")
+        try:
+            response = httpx.get(url)
+            response.raise_for_status()
+            properties = response.json()["PropertyTable"]["Properties"]
+        except httpx.HTTPError as e:
+            raise ValueError("Failed to retrieve molecule names from PubChem") from e
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(
+                "Unexpected response structure while retrieving molecule names from PubChem"
+            ) from e
+
+        for prop in properties:
+            if "CID" in prop and "Title" in prop:
+                names[int(prop["CID"])] = prop["Title"]
+
+    return names
 
 
 def _resolve_chromatogram(
@@ -33,59 +117,255 @@ def _resolve_chromatogram(
     raise ValueError("No chromatogram found.")
 
 
+def measurements_peak_index(
+    measurements: list[Measurement], wavelength: float | None
+) -> tuple[np.ndarray, list[Peak]]:
+    """Orders the peaks of the chromatograms at a wavelength of all measurements
+    by their retention time.
+
+    Args:
+        measurements (list[Measurement]): The measurements containing the peaks.
+        wavelength (float | None): Wavelength of the chromatograms.
+
+    Returns:
+        tuple[np.ndarray, list[Peak]]: Ascending retention times and the
+            correspondingly ordered peaks.
+    """
+    peaks = [
+        peak
+        for meas in measurements
+        for peak in _resolve_chromatogram(meas.chromatograms, wavelength).peaks
+    ]
+    rts = np.fromiter(
+        (peak.retention_time for peak in peaks),
+        dtype=np.float64,
+        count=len(peaks),
+    )
+    order = np.argsort(rts, kind="stable")
+
+    return rts[order], [peaks[i] for i in order]
+
+
+def retention_windows(
+    rts: np.ndarray, centers: np.ndarray, tolerances: np.ndarray
+) -> list[np.ndarray]:
+    """Locates the retention times within the tolerance of each center. A peak lies
+    within a window if `rt - tolerance < center < rt + tolerance`, as checked for
+    single peaks. The candidates of all windows are found in one search over
+    windows of twice the tolerance, which are then filtered by that comparison.
+
+    Args:
+        rts (np.ndarray): Ascending retention times of the peaks.
+        centers (np.ndarray): Retention times of the molecules.
+        tolerances (np.ndarray): Retention time tolerances of the molecules.
+
+    Returns:
+        list[np.ndarray]: Indices of the retention times within each window.
+    """
+    lowers = np.searchsorted(rts, centers - 2 * tolerances, side="left")
+    uppers = np.searchsorted(rts, centers + 2 * tolerances, side="right")
+
+    windows = []
+    for center, tolerance, lower, upper in zip(centers, tolerances, lowers, uppers):
+        candidates = rts[lower:upper]
+        inside = (candidates - tolerance < center) & (center < candidates + tolerance)
+        windows.append(lower + np.flatnonzero(inside))
+
+    return windows
+
+
 def pick_peak(
     chromatograms: list[Chromatogram], retention_time: float, tolerance: float
-):
+) -> list[Peak]:
+    """Collects the peaks within the retention time tolerance across chromatograms.
+    The reference retention time follows each matched peak to account for
+    drifting retention times.
+
+    Args:
+        chromatograms (list[Chromatogram]): Chromatograms to search.
+        retention_time (float): Initial reference retention time.
+        tolerance (float): Retention time tolerance.
+
+    Returns:
+        list[Peak]: The matched peaks.
+    """
     current_retention = retention_time
     peaks = []
 
     for chrom in chromatograms:
-        for peak in chrom.peaks:
-            if abs(peak.retention_time - current_retention) < tolerance:
-                peaks.append(peak)
-                current_retention = peak.retention_time
-        else:
-            pass
+        rts = np.fromiter(
+            (peak.retention_time for peak in chrom.peaks),
+            dtype=np.float64,
+            count=len(chrom.peaks),
+        )
+        # the remaining peaks are compared against the last match
+        start = 0
+        while True:
+            matches = np.flatnonzero(
+                np.abs(rts[start:] - current_retention) < tolerance
+            )
+            if matches.size == 0:
+                break
 
+            idx = start + int(matches[0])
+            peaks.append(chrom.peaks[idx])
+            current_retention = rts[idx]
+            start = idx + 1
 
-def generate_visibility(hover_text: str, fig: go.Figure) -> list[bool]:
-    visibility = []
-    for trace in fig.data:
-        if trace.hovertext == hover_text:
-            visibility.append(True)
-        else:
-            visibility.append(False)
-    return visibility
+    return peaks
+
+
+def lttb_indices(x_values, y_values, max_points: int) -> np.ndarray:
+    """Selects the points of a line that preserve its visual shape using the
+    Largest-Triangle-Three-Buckets algorithm. The first and last points are
+    always kept, every bucket in between contributes the point spanning the
+    largest triangle with the previously selected point and the mean of the
+    next bucket.
+
+    Args:
+        x_values (list[float] | np.ndarray): The x-values of the line.
+        y_values (list[float] | np.ndarray): The y-values of the line.
+        max_points (int): The maximum number of points to keep, at least 3.
+
+    Returns:
+        np.ndarray: Sorted indices of the selected points.
+    """
+    assert max_points >= 3, "At least 3 points need to be kept."
+
+    n_points = min(len(x_values), len(y_values))
+    if n_points <= max_points:
+        return np.arange(n_points)
+
+    x = np.asarray(x_values[:n_points], dtype=np.float64)
+    y = np.asarray(y_values[:n_points], dtype=np.float64)
+
+    # buckets partition the inner points, each holds at least one point
+    edges = np.linspace(1, n_points - 1, max_points - 1).astype(np.intp)
+    counts = np.diff(edges)
+    mean_x = np.add.reduceat(x[1:-1], edges[:-1] - 1) / counts
+    mean_y = np.add.reduceat(y[1:-1], edges[:-1] - 1) / counts
+    # the last bucket is followed by the last point
+    mean_x = np.append(mean_x[1:], x[-1])
+    mean_y = np.append(mean_y[1:], y[-1])
+
+    indices = np.empty(max_points, dtype=np.intp)
+    indices[0] = 0
+    indices[-1] = n_points - 1
+    selected = 0
+    for bucket, (start, end) in enumerate(itertools.pairwise(edges)):
+        area = np.abs(
+            (x[selected] - mean_x[bucket]) * (y[start:end] - y[selected])
+            - (x[selected] - x[start:end]) * (mean_y[bucket] - y[selected])
+        )
+        selected = start + int(np.argmax(area))
+        indices[bucket + 1] = selected
+
+    return indices
+
+
+def build_visibility_index(fig: go.Figure) -> dict[str, np.ndarray]:
+    """Maps the hover text of the traces in a figure to a boolean mask, marking
+    the traces with the respective hover text.
+
+    Args:
+        fig (go.Figure): The figure containing the traces.
 
+    Returns:
+        dict[str, np.ndarray]: Hover text as keys and visibility masks as values.
+    """
+    hover_texts = [trace.hovertext for trace in fig.data]
+    index: dict[str, np.ndarray] = {}
+    for trace_idx, hover_text in enumerate(hover_texts):
+        if hover_text not in index:
+            index[hover_text] = np.zeros(len(hover_texts), dtype=bool)
+        index[hover_text][trace_idx] = True
+
+    return index
 
-def generate_gaussian_data(
-    amplitude, center, half_height_diameter, start, end, num_points=100
-):
+
+def skewnorm_pdf(x_values, skew, loc, scale) -> np.ndarray:
     """
-    Generate x and y data for a Gaussian curve.
+    Evaluate the skew-normal probability density function.
+
+    Equivalent to `scipy.stats.skewnorm.pdf(x_values, skew, loc=loc, scale=scale)`
+    without the generic distribution dispatch. All parameters broadcast.
 
     Parameters:
-    - amplitude: The peak height of the Gaussian.
-    - center: The position of the center of the peak.
-    - half_height_diameter: The full width at half maximum (FWHM) of the peak.
-    - start: The starting x-value.
-    - end: The ending x-value.
-    - num_points: Number of points to generate (default is 100).
+    - x_values: The x-values on which the density is evaluated.
+    - skew: The skewness parameter.
+    - loc: The location of the distribution.
+    - scale: The scale of the distribution.
 
     Returns:
-    - x_values: Array of x-values.
-    - y_values: Array of y-values corresponding to the Gaussian curve.
+    - y_values: Array of density values.
     """
-    # Calculate sigma from the half-height diameter (FWHM)
-    sigma = half_height_diameter / (2 * np.sqrt(2 * np.log(2)))
+    from scipy.special import ndtr
 
-    # Generate x values
-    x_values = np.linspace(start, end, num_points)
+    z = (np.asarray(x_values, dtype=np.float64) - loc) / scale
+    return (2.0 * _INV_SQRT_2PI / scale) * np.exp(-0.5 * z * z) * ndtr(skew * z)
 
-    # Generate y values using the Gaussian function
-    y_values = amplitude * np.exp(-((x_values - center) ** 2) / (2 * sigma**2))
 
-    return x_values, y_values
+def generate_peak_curves(
+    peaks: list[Peak], num_points: int = 100
+) -> list[tuple[np.ndarray, np.ndarray, str] | None]:
+    """
+    Generate x and y data for the curves of multiple peaks at once.
+
+    Peaks with start, end and width are modeled as Gaussians between their start
+    and end, peaks with skew and width as skew-normal curves within three widths
+    around their retention time. All peaks of one shape are evaluated together on
+    a `(n_peaks, num_points)` grid.
+
+    Parameters:
+    - peaks: The peaks to model.
+    - num_points: Number of points per curve (default is 100).
+
+    Returns:
+    - curves: For each peak the x-values, the y-values and the shape, which is
+      either "gaussian" or "skewnorm", or None if the peak can not be modeled.
+    """
+    curves: list[tuple[np.ndarray, np.ndarray, str] | None] = [None] * len(peaks)
+
+    gaussian, skewed = [], []
+    for idx, peak in enumerate(peaks):
+        if peak.peak_start and peak.peak_end and peak.width:
+            gaussian.append(idx)
+        elif peak.skew and peak.width:
+            skewed.append(idx)
+
+    if gaussian:
+        amplitudes, centers, widths, starts, ends = np.array(
+            [
+                (p.amplitude, p.retention_time, p.width, p.peak_start, p.peak_end)
+                for p in (peaks[idx] for idx in gaussian)
+            ],
+            dtype=np.float64,
+        ).T[:, :, np.newaxis]
+        sigmas = widths * _FWHM_TO_SIGMA
+        x_values = np.linspace(starts[:, 0], ends[:, 0], num_points, axis=-1)
+        y_values = amplitudes * np.exp(-((x_values - centers) ** 2) / (2 * sigmas**2))
+        for row, idx in enumerate(gaussian):
+            curves[idx] = (x_values[row], y_values[row], "gaussian")
+
+    if skewed:
+        amplitudes, centers, widths, skews = np.array(
+            [
+                (p.amplitude, p.retention_time, p.width, p.skew)
+                for p in (peaks[idx] for idx in skewed)
+            ],
+            dtype=np.float64,
+        ).T[:, :, np.newaxis]
+        x_values = np.linspace(
+            (centers - 3 * widths)[:, 0],
+            (centers + 3 * widths)[:, 0],
+            num_points,
+            axis=-1,
+        )
+        y_values = skewnorm_pdf(x_values, skews, centers, widths) * amplitudes
+        for row, idx in enumerate(skewed):
+            curves[idx] = (x_values[row], y_values[row], "skewnorm")
+
+    return curves
 
 
 def visualize_enzymeml(enzymeml_doc: EnzymeMLDocument, return_fig: bool = False):
@@ -95,14 +375,21 @@ def visualize_enzymeml(enzymeml_doc: EnzymeMLDocument, return_fig: bool = False)
         enzymeml_doc (EnzymeMLDocument): The EnzymeML document to visualize
         return_fig (bool, optional): Whether to return the figure. Defaults to False.
     """
+    from matplotlib import pyplot as plt
+    from pyenzyme import DataTypes
+
+    handles = []
     for species in enzymeml_doc.measurements[0].species_data:
         if species.data:
-            plt.scatter(
-                species.time,
-                species.data,
-                label=get_species_by_id(enzymeml_doc, species.species_id).name,
+            handles.append(
+                plt.scatter(
+                    species.time,
+                    species.data,
+                    label=get_species_by_id(enzymeml_doc, species.species_id).name,
+                )
             )
-    plt.legend()
+    # a fixed anchor in the upper right corner skips the search for the best location
+    plt.legend(handles=handles, loc="upper right", bbox_to_anchor=(1.0, 1.0))
 
     # handel y label
     if species.data_type == DataTypes.PEAK_AREA:
@@ -124,36 +411,22 @@ def get_species_by_id(enzymeml_doc: EnzymeMLDocument, species_id: str):
 
 
 def unit_to_str(unit: UnitDefinition) -> str:
-    magnitude_dict = {
-        1: "",
-        -1: "",
-        -3: "m",
-        -6: "µ",
-        -9: "n",
-        -12: "p",
-    }
-
     # Handle single base unit cases
     if len(unit.base_units) == 1:
         base_unit = unit.base_units[0]
-
-        if base_unit.kind.value == "second":
-            if base_unit.multiplier == 1:
-                return "s"
-            elif base_unit.multiplier == 60:
-                return "min"
-            elif base_unit.multiplier == 3600:
-                return "h"
-            else:
-                return unit.name or ""
-        else:
-            return unit.name or ""
+        return _UNIT_TABLE.get(
+            (_kind_value(base_unit.kind), base_unit.multiplier), unit.name or ""
+        )
 
     # Handle mole per litre cases
     elif len(unit.base_units) == 2:
         u1, u2 = unit.base_units
-        if u1.kind.value == "mole" and u2.kind.value == "litre" and u2.exponent == -1:
-            return f"{magnitude_dict[u1.scale]}M"
+        if (
+            _kind_value(u1.kind) == "mole"
+            and _kind_value(u2.kind) == "litre"
+            and u2.exponent == -1
+        ):
+            return _CONC_SCALE.get(u1.scale, unit.name or "")
         else:
             return unit.name or ""
 
@@ -161,6 +434,12 @@ def unit_to_str(unit: UnitDefinition) -> str:
     return unit.name or ""
 
 
+def _kind_value(kind) -> str:
+    """Returns the string value of a unit kind, which is either an enum member
+    or already its value if the model was created with `use_enum_values`."""
+    return getattr(kind, "value", kind)
+
+
 ###########
 
 # def _apply_calibrators(calibrators = list[Calibrator]):
@@ -1,7 +1,7 @@
 from chromatopy.model import UnitType as ChromUnitType
 from chromatopy.tools.read_static import read_static_file
 
-from .units import BaseUnit, Prefix, UnitDefinition
+from .units import BaseUnit, UnitDefinition, k, m, n, u
 
 BaseUnit.model_rebuild()
 UnitDefinition.model_rebuild()
@@ -53,13 +53,6 @@ class Unit:
         return BaseUnit(kind=ChromUnitType.DIMENSIONLESS, exponent=1, scale=1)
 
 
-###### Single Prefixes ######
-
-k = Prefix.k
-m = Prefix.m
-u = Prefix.u
-n = Prefix.n
-
 ##### Predefined units #####
 
 # Dimensionless
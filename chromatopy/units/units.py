@@ -1,5 +1,6 @@
-from enum import Enum
-from functools import partial
+from collections.abc import Callable
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from pydantic import model_validator
 
@@ -13,6 +14,9 @@ from chromatopy.model import (
     UnitType,
 )
 
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
 UNIT_OF_MEAS_TYPE = "OBO:UO_0000000"
 NAME_MAPS = {
     UnitType.LITRE: "l",
@@ -21,79 +25,122 @@ NAME_MAPS = {
     UnitType.GRAM: "g",
     UnitType.KELVIN: "K",
 }
+# Short names keyed by the enum members as well as their values and names
+_NAME_LOOKUP = {
+    **NAME_MAPS,
+    **{kind.value: name for kind, name in NAME_MAPS.items()},
+    **{kind.name: name for kind, name in NAME_MAPS.items()},
+}
+PREFIX_MAPS = {
+    3: "k",
+    -3: "m",
+    -6: "u",
+    -9: "n",
+}
+# Formatted exponents indexed by their magnitude
+EXPONENT_STRS = ("", "", "^2", "^3", "^4", "^5", "^6")
+
+
+def _set_field(model: "BaseModel", field: str, value: object) -> None:
+    """Assign a field of a unit model, bypassing pydantic's `__setattr__` handling.
+
+    Only used for values maintained by the unit operations themselves.
+
+    Args:
+        model (BaseModel): The model to update.
+        field (str): The name of the field.
+        value (object): The new value.
+    """
+    model.__dict__[field] = value
+    model.__pydantic_fields_set__.add(field)
+
 
+def _copy_base(base: _BaseUnit, **update: object) -> _BaseUnit:
+    """Return a copy of a base unit with the given fields replaced.
 
-def _is_unit(other: object) -> bool:
-    """Check if the given object is an instance of 'unit'.
+    Unit operations build their results from copies to leave the operands,
+    such as the predefined units, untouched.
 
     Args:
-        other (object): The object to check.
+        base (_BaseUnit): The base unit to copy.
+        **update: The fields to replace.
 
     Returns:
-        bool: True if the object is an instance of 'unit', False otherwise.
+        _BaseUnit: The copied base unit.
     """
-    return other.__class__.__name__ == "unit"
+    return base.model_copy(update=update, deep=True)
 
 
-def set_scale(unit: _BaseUnit, scale: int) -> _BaseUnit:
-    """Set the scale of a unit.
+def _to_denominator(base: _BaseUnit) -> _BaseUnit:
+    """Return a copy of the base unit with a negative exponent.
 
     Args:
-        unit (_BaseUnit): The unit to set the scale for.
-        scale (int): The scale value to set.
+        base (_BaseUnit): The base unit to move to the denominator.
 
     Returns:
-        _BaseUnit: The unit with the updated scale.
+        _BaseUnit: The copied base unit with a negative exponent.
     """
-    unit.scale = scale
-    return unit
+    return _copy_base(base, exponent=-abs(base.exponent))
 
 
-class Prefix(Enum):
-    """Enumeration for unit prefixes with corresponding scales."""
+class Prefix:
+    """Unit prefix with its corresponding scale."""
 
-    k = partial(set_scale, scale=3)
-    m = partial(set_scale, scale=-3)
-    u = partial(set_scale, scale=-6)
-    n = partial(set_scale, scale=-9)
+    __slots__ = ("scale",)
+
+    def __init__(self, scale: int):
+        self.scale = scale
+
+    def __repr__(self) -> str:
+        return f"Prefix(scale={self.scale})"
 
     def __mul__(self, other: _BaseUnit) -> _BaseUnit:
         """Multiply prefix with a BaseUnit.
 
-        When multiplying a prefix with a BaseUnit, the scale of the BaseUnit is updated.
+        When multiplying a prefix with a BaseUnit, a copy of the BaseUnit with
+        the scale of the prefix is returned.
 
         Args:
             other (_BaseUnit): The other operand, which should be a BaseUnit.
 
         Returns:
-            _BaseUnit: The resulting unit with the prefix applied.
-
-        Raises:
-            TypeError: If the other operand is not a BaseUnit.
+            _BaseUnit: The resulting unit with the prefix applied or
+                NotImplemented if the other operand is not a BaseUnit.
         """
         if isinstance(other, _BaseUnit):
-            return self.value(other)
+            return _copy_base(other, scale=self.scale)
 
-        raise TypeError(
-            f"unsupported operand type(s) for *: 'Prefix' and '{type(other)}'"
-        )
+        return NotImplemented
+
+
+k = Prefix(3)
+m = Prefix(-3)
+u = Prefix(-6)
+n = Prefix(-9)
+
+# the prefixes stay accessible as class attributes, such as `Prefix.k`
+Prefix.k = k
+Prefix.m = m
+Prefix.u = u
+Prefix.n = n
 
 
 class UnitDefinition(_UnitDefinition):
     """Extended UnitDefinition class with additional operations."""
 
     @model_validator(mode="after")
-    def set_name_and_type(self):
+    def set_name_and_type(self) -> "UnitDefinition":
         """Initialize the UnitDefinition object."""
         self._get_name()
-        self.ld_type = [UNIT_OF_MEAS_TYPE]
+        # a fresh list per instance, `add_type_term` appends to it in place
+        _set_field(self, "ld_type", [UNIT_OF_MEAS_TYPE])
         return self
 
     def __rtruediv__(self, other: object) -> "UnitDefinition":
         """Right division operation to handle unit division.
 
-        If the other operand is a UnitDefinition, the base units are appended to the current unit.
-        If the other operand is a BaseUnit, the base unit is appended to the current unit.
+        The result is a new unit, the operands are left untouched. If the other operand
+        is a UnitDefinition or a BaseUnit, its base units are added to the result.
 
         Args:
             other (object): The numerator in the division.
@@ -102,25 +149,22 @@ class UnitDefinition(_UnitDefinition):
             UnitDefinition: The resulting unit after division.
 
         Raises:
-            TypeError: If the other operand type is unsupported.
+            TypeError: If neither operand supports the operation.
         """
-        for base in self.base_units:
-            base.exponent = -abs(base.exponent)
+        base_units = [_to_denominator(base) for base in self.base_units]
 
         if isinstance(other, UnitDefinition):
-            self.base_units.extend(other.base_units)
+            base_units.extend(_copy_base(base) for base in other.base_units)
         elif isinstance(other, _BaseUnit):
-            self.base_units.append(other)
-
-        self._get_name()
+            base_units.append(_copy_base(other))
 
-        return self
+        return UnitDefinition(base_units=base_units)
 
     def __truediv__(self, other: object) -> "UnitDefinition":
         """Division operation to handle unit division.
 
-        If the other operand is a UnitDefinition, the base units are appended to the current unit.
-        If the other operand is a BaseUnit, the base unit is appended to the current unit.
+        The result is a new unit, the operands are left untouched. If the other operand
+        is a UnitDefinition or a BaseUnit, its base units are added to the result.
 
         Args:
             other (object): The numerator in the
@@ -129,21 +173,17 @@ class UnitDefinition(_UnitDefinition):
             UnitDefinition: The resulting unit after division.
 
         Raises:
-            TypeError: If the other operand type is unsupported.
+            TypeError: If neither operand supports the operation.
 
         """
+        base_units = [_copy_base(base) for base in self.base_units]
 
         if isinstance(other, UnitDefinition):
-            for base in other.base_units:
-                base.exponent = -abs(base.exponent)
-            self.base_units.extend(other.base_units)
+            base_units.extend(_to_denominator(base) for base in other.base_units)
         elif isinstance(other, _BaseUnit):
-            other.exponent = -abs(other.exponent)
-            self.base_units.append(other)
+            base_units.append(_to_denominator(other))
 
-        self._get_name()
-
-        return self
+        return UnitDefinition(base_units=base_units)
 
     def __mul__(self, other: object) -> "UnitDefinition":
         """Multiplication operation to handle unit multiplication.
@@ -155,26 +195,22 @@ class UnitDefinition(_UnitDefinition):
             UnitDefinition: The resulting unit after multiplication.
 
         Raises:
-            TypeError: If the other operand type is unsupported.
+            TypeError: If neither operand supports the operation.
         """
         if isinstance(other, (int, float)):
-            for base in self.base_units:
-                if base.multiplier:
-                    base.multiplier *= other
-                else:
-                    base.multiplier = other
-
-            self._get_name()
+            # unset multipliers are replaced by the factor
+            return UnitDefinition(
+                base_units=[
+                    _copy_base(base, multiplier=(base.multiplier or 1) * other)
+                    for base in self.base_units
+                ]
+            )
 
-            return self
+        return NotImplemented
 
-        raise TypeError(
-            f"unsupported operand type(s) for *: 'UnitDefinition' and '{type(other)}'"
-        )
-
-    def _get_name(self):
+    def _get_name(self) -> "UnitDefinition":
         """Get the name of the unit based on the base units."""
-        self.name = str(self)
+        _set_field(self, "name", str(self))
 
         return self
 
@@ -187,31 +223,39 @@ class UnitDefinition(_UnitDefinition):
         Raises:
             ValueError: If no base units are found.
         """
+        return self._format_unit(
+            tuple((base.scale, base.kind, base.exponent) for base in self.base_units)
+        )
 
-        numerator = [
-            self._map_prefix(base.scale)
-            + self._map_name(base.kind)
-            + self._exponent(base.exponent)
-            for base in self.base_units
-            if base.exponent > 0
-        ]
-        denominator = [
-            self._map_prefix(base.scale)
-            + self._map_name(base.kind)
-            + self._exponent(base.exponent)
-            for base in self.base_units
-            if base.exponent < 0
-        ]
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _format_unit(key: tuple[tuple[float | None, UnitType, int], ...]) -> str:
+        """Format the base units of a unit definition as a string.
+
+        Args:
+            key (tuple): The `(scale, kind, exponent)` triples of the base units.
 
-        numerator_str = " ".join(numerator) if numerator else ""
-        denominator_str = " ".join(denominator) if denominator else ""
+        Returns:
+            str: The formatted unit string.
+        """
+        format_base = UnitDefinition._format_base
+        numerator = " ".join(
+            format_base(scale, kind, exponent)
+            for scale, kind, exponent in key
+            if exponent > 0
+        )
+        denominator = " ".join(
+            format_base(scale, kind, exponent)
+            for scale, kind, exponent in key
+            if exponent < 0
+        )
 
-        if numerator_str and denominator_str:
-            return f"{numerator_str} / {denominator_str}"
-        elif numerator_str:
-            return numerator_str
-        elif denominator_str:
-            return f"1 / {denominator_str}"
+        if numerator and denominator:
+            return f"{numerator} / {denominator}"
+        elif numerator:
+            return numerator
+        elif denominator:
+            return f"1 / {denominator}"
 
         raise ValueError("No base units found")
 
@@ -229,20 +273,37 @@ class UnitDefinition(_UnitDefinition):
         if scale is None:
             return ""
 
-        mapping = {
-            3: "k",
-            -3: "m",
-            -6: "u",
-            -9: "n",
-        }
+        return PREFIX_MAPS.get(scale, "")
 
-        return mapping.get(scale, "")
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _format_base(scale: int | None, kind: UnitType, exponent: int) -> str:
+        """Format a single base unit, such as `mmol` or `s^2`.
+
+        Args:
+            scale (int | None): The scale of the base unit.
+            kind (UnitType): The kind of the base unit.
+            exponent (int): The exponent of the base unit.
+
+        Returns:
+            str: The formatted base unit.
+        """
+        return (
+            UnitDefinition._map_prefix(scale)
+            + UnitDefinition._map_name(kind)
+            + UnitDefinition._exponent(exponent)
+        )
 
     @staticmethod
-    def _map_name(kind: UnitType) -> str:
-        if isinstance(kind, str):  # TODO: find issue of incorrect enum usage
-            return NAME_MAPS.get(kind, kind.capitalize())
-        return NAME_MAPS.get(kind, kind.name.capitalize())
+    def _map_name(kind: UnitType | str) -> str:
+        name = _NAME_LOOKUP.get(kind)
+        if name is not None:
+            return name
+
+        # kinds are stored as plain strings if enum values are used
+        if isinstance(kind, str):
+            return kind.capitalize()
+        return kind.name.capitalize()
 
     @staticmethod
     def _exponent(exponent: int) -> str:
@@ -254,10 +315,11 @@ class UnitDefinition(_UnitDefinition):
         Returns:
             str: The formatted exponent string.
         """
-        if abs(exponent) == 1:
-            return ""
+        magnitude = -exponent if exponent < 0 else exponent
+        if magnitude < len(EXPONENT_STRS):
+            return EXPONENT_STRS[magnitude]
 
-        return f"^{abs(exponent)}"
+        return f"^{magnitude}"
 
 
 class BaseUnit(_BaseUnit):
@@ -273,22 +335,13 @@ class BaseUnit(_BaseUnit):
             UnitDefinition: The resulting unit after division.
 
         Raises:
-            TypeError: If the other operand type is unsupported.
+            TypeError: If neither operand supports the operation.
         """
-        if isinstance(other, UnitDefinition):
-            self.exponent = -self.exponent
-            other.base_units.append(self)
-
-            other._get_name()
+        handler = _dispatch(_RTRUEDIV_DISPATCH, other)
+        if handler is not None:
+            return handler(self, other)
 
-            return other
-        elif isinstance(other, (int, float)):
-            self.exponent = -self.exponent
-            return self
-
-        raise TypeError(
-            f"unsupported operand type(s) for /: 'BaseUnit' and '{type(other)}'"
-        )
+        return NotImplemented
 
     def __truediv__(self, other: object) -> "UnitDefinition":
         """Division operation to handle unit division.
@@ -300,75 +353,134 @@ class BaseUnit(_BaseUnit):
             UnitDefinition: The resulting unit after division.
 
         Raises:
-            TypeError: If the other operand type is unsupported.
+            TypeError: If neither operand supports the operation.
         """
-        if isinstance(other, BaseUnit):
-            other.exponent = -other.exponent
-            return UnitDefinition(base_units=[self, other])._get_name()
-        elif isinstance(other, UnitDefinition):
-            for base_unit in other.base_units:
-                base_unit.exponent = -base_unit.exponent
-            other.base_units.append(self)
-            other._get_name()
-
-            return other
-
-        raise TypeError(
-            f"unsupported operand type(s) for /: 'BaseUnit' and '{type(other)}'"
-        )
+        handler = _dispatch(_TRUEDIV_DISPATCH, other)
+        if handler is not None:
+            return handler(self, other)
+
+        return NotImplemented
 
-    def __pow__(self, other: int) -> "_BaseUnit":
+    def __pow__(self, other: int) -> "BaseUnit":
         """Exponentiation operation to handle unit exponentiation.
 
         Args:
             other (int): The exponent value.
 
         Returns:
-            _BaseUnit: The resulting unit after exponentiation.
+            BaseUnit: The resulting unit after exponentiation.
 
         Raises:
-            TypeError: If the exponent is not an integer.
+            TypeError: If the exponent is not an integer and the operand
+                does not support the operation.
         """
         if isinstance(other, int):
-            self.exponent = other
-            return self
+            return _copy_base(self, exponent=other)
 
-        raise TypeError(
-            f"unsupported operand type(s) for **: 'BaseUnit' and '{type(other)}'"
-        )
+        return NotImplemented
 
-    def __mul__(self, other: object) -> object:
+    def __mul__(self, other: object) -> "UnitDefinition | BaseUnit":
         """Multiplication operation to handle unit multiplication.
 
         Args:
             other (object): The multiplier in the multiplication.
 
         Returns:
-            object: The resulting unit after multiplication.
+            UnitDefinition | BaseUnit: The resulting unit after multiplication.
 
         Raises:
-            TypeError: If the other operand type is unsupported.
+            TypeError: If neither operand supports the operation.
         """
-        if isinstance(other, BaseUnit):
-            if self.exponent < 0 or other.exponent < 0:
-                self.exponent = abs(self.exponent)
-                other.exponent = abs(other.exponent)
-
-            return UnitDefinition(base_units=[self, other])._get_name()
-        elif isinstance(other, UnitDefinition):
-            other.base_units.append(self)
-            other._get_name()
-
-            return other
-        elif isinstance(other, Prefix):
-            return other * self
-        elif isinstance(other, (int, float)):
-            if self.multiplier:
-                self.multiplier *= other
-            else:
-                self.multiplier = other
-            return self
-
-        raise TypeError(
-            f"unsupported operand type(s) for *: 'BaseUnit' and '{type(other)}'"
+        handler = _dispatch(_MUL_DISPATCH, other)
+        if handler is not None:
+            return handler(self, other)
+
+        return NotImplemented
+
+    def _rtruediv_unit_definition(self, other: UnitDefinition) -> UnitDefinition:
+        base_units = [_copy_base(base) for base in other.base_units]
+        base_units.append(_copy_base(self, exponent=-self.exponent))
+
+        return UnitDefinition(base_units=base_units)
+
+    def _rtruediv_scalar(self, other: float) -> "BaseUnit":
+        return _copy_base(self, exponent=-self.exponent)
+
+    def _truediv_base_unit(self, other: "BaseUnit") -> UnitDefinition:
+        return UnitDefinition(
+            base_units=[_copy_base(self), _copy_base(other, exponent=-other.exponent)]
         )
+
+    def _truediv_unit_definition(self, other: UnitDefinition) -> UnitDefinition:
+        base_units = [
+            _copy_base(base, exponent=-base.exponent) for base in other.base_units
+        ]
+        base_units.append(_copy_base(self))
+
+        return UnitDefinition(base_units=base_units)
+
+    def _mul_base_unit(self, other: "BaseUnit") -> UnitDefinition:
+        if self.exponent < 0 or other.exponent < 0:
+            base_units = [
+                _copy_base(self, exponent=abs(self.exponent)),
+                _copy_base(other, exponent=abs(other.exponent)),
+            ]
+        else:
+            base_units = [_copy_base(self), _copy_base(other)]
+
+        return UnitDefinition(base_units=base_units)
+
+    def _mul_unit_definition(self, other: UnitDefinition) -> UnitDefinition:
+        base_units = [_copy_base(base) for base in other.base_units]
+        base_units.append(_copy_base(self))
+
+        return UnitDefinition(base_units=base_units)
+
+    def _mul_prefix(self, other: Prefix) -> "BaseUnit":
+        return other * self
+
+    def _mul_scalar(self, other: float) -> "BaseUnit":
+        if self.multiplier:
+            return _copy_base(self, multiplier=self.multiplier * other)
+        return _copy_base(self, multiplier=other)
+
+
+# Operand type to handler mappings of the BaseUnit operators
+_RTRUEDIV_DISPATCH: dict[type, Callable] = {
+    UnitDefinition: BaseUnit._rtruediv_unit_definition,
+    int: BaseUnit._rtruediv_scalar,
+    float: BaseUnit._rtruediv_scalar,
+}
+_TRUEDIV_DISPATCH: dict[type, Callable] = {
+    BaseUnit: BaseUnit._truediv_base_unit,
+    UnitDefinition: BaseUnit._truediv_unit_definition,
+}
+_MUL_DISPATCH: dict[type, Callable] = {
+    BaseUnit: BaseUnit._mul_base_unit,
+    UnitDefinition: BaseUnit._mul_unit_definition,
+    Prefix: BaseUnit._mul_prefix,
+    int: BaseUnit._mul_scalar,
+    float: BaseUnit._mul_scalar,
+}
+
+
+def _dispatch(table: dict[type, Callable], other: object) -> Callable | None:
+    """Get the handler for the type of the operand. Subclasses of the registered
+    types are resolved through their MRO once and then cached in the table,
+    unsupported types are not cached.
+
+    Args:
+        table (dict[type, Callable]): The dispatch table of the operator.
+        other (object): The other operand.
+
+    Returns:
+        Callable | None: The handler or None if the type is not supported.
+    """
+    other_type = type(other)
+    try:
+        return table[other_type]
+    except KeyError:
+        handler = next((table[cls] for cls in other_type.__mro__ if cls in table), None)
+        if handler is not None:
+            table[other_type] = handler
+        return handler
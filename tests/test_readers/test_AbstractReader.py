@@ -1,6 +1,7 @@
-import os
+from pathlib import Path
 
 import pytest
+from pydantic import ValidationError
 
 from chromatopy.readers.abstractreader import AbstractReader, UnitConsistencyError
 from chromatopy.units import minute
@@ -40,7 +41,7 @@ def test_parse_time_and_unit_success(working_data_dir):
     )
 
     # Extract only the filenames
-    file_names = [os.path.basename(file) for file in reader.file_paths]
+    file_names = [Path(file).name for file in reader.file_paths]
 
     assert reader.values == [0.0, 0.33, 3.4, 10]
     assert reader.unit == minute
@@ -68,3 +69,15 @@ def test_parse_time_and_unit_inconsistent_units(inconsistent_units_dir):
             temperature_unit=C,
             mode="timecourse",
         )
+
+
+@pytest.mark.parametrize("n_workers", [0, -1])
+def test_n_workers_must_be_positive(working_data_dir, n_workers):
+    with pytest.raises(ValidationError):
+        TestAbstractReader(
+            dirpath=working_data_dir,
+            ph=7.0,
+            temperature=25.0,
+            mode="timecourse",
+            n_workers=n_workers,
+        )
@@ -4,7 +4,7 @@ from chromatopy.readers.asm import ASMReader
 from chromatopy.units import C, minute
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def asm_lc_1():
     reader = ASMReader(
         dirpath="docs/examples/data/asm",
@@ -19,7 +19,7 @@ def asm_lc_1():
     return reader
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def asm_lc_2():
     reader = ASMReader(
         dirpath="docs/examples/data/asm_2",
@@ -34,7 +34,7 @@ def asm_lc_2():
     return reader
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def asm_gc_1():
     reader = ASMReader(
         dirpath="docs/examples/data/asm_3",
@@ -83,6 +83,31 @@ def test_read_asm_lc(asm_lc_1):
     )
 
 
+def _peak_summary(measurements):
+    return [
+        (
+            meas.id,
+            meas.data.value,
+            [
+                (
+                    chrom.wavelength,
+                    chrom.times,
+                    chrom.signals,
+                    [(peak.retention_time, peak.area) for peak in chrom.peaks],
+                )
+                for chrom in meas.chromatograms
+            ],
+        )
+        for meas in measurements
+    ]
+
+
+def test_read_asm_lc_with_workers(asm_lc_1):
+    reader = asm_lc_1.model_copy(update={"n_workers": 4})
+
+    assert _peak_summary(reader.read()) == _peak_summary(asm_lc_1.read())
+
+
 def test_read_asm_lc_2(asm_lc_2):
     measurements = asm_lc_2.read()
     assert len(measurements) == 10
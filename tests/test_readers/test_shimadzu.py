@@ -1,27 +1,39 @@
-# import unittest
+import pytest
 
-# import pytest
+from chromatopy.readers.shimadzu import ShimadzuReader
+from chromatopy.units import minute
 
-# from chromatopy.readers.shimadzu import ShimadzuReader
-# from chromatopy.units import min
+DIR_PATH = "docs/examples/data/shimadzu"
 
-# DIR_PATH = "tests/test_readers/data/shimadzu"
 
+@pytest.fixture(scope="module")
+def shimadzu_measurements():
+    reader = ShimadzuReader(
+        dirpath=DIR_PATH,
+        values=[0, 1, 2, 3, 4, 5, 6, 7, 8],
+        unit=minute,
+        ph=7.4,
+        temperature=25.0,
+        silent=True,
+        mode="timecourse",
+    )
+    return reader.read()
 
-# @pytest.mark.readers
-# class TestShimadzuReader(unittest.TestCase):
-#     # can read a single file and return a dictionary
-#     def test_read_shimadzu(self):
-#         reader = ShimadzuReader(
-#             dirpath=DIR_PATH,
-#             reaction_times=[0] * 9,
-#             time_unit=min,
-#             ph=7.4,
-#             temperature=25.0,
-#             temperature_unit="C",
-#         )
 
-#         measurements = reader.read()
+def test_read_shimadzu(shimadzu_measurements):
+    assert len(shimadzu_measurements) == 9
+    assert shimadzu_measurements[0].chromatograms[0].peaks[0].area == pytest.approx(
+        1278.0
+    )
 
-#         assert len(measurements) == 9
-#         assert measurements[0].chromatograms[0].peaks[0].area == pytest.approx(1278.0)
+
+@pytest.mark.parametrize(
+    "key, expected",
+    [
+        ("id", "Output-sample 0"),
+        ("injection_volume", 20.0),
+        ("dilution_factor", 1.0),
+    ],
+)
+def test_measurement_field(shimadzu_measurements, key, expected):
+    assert getattr(shimadzu_measurements[0], key) == expected
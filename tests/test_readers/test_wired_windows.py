@@ -1,21 +1,17 @@
-import os
+import pytest
 
 from chromatopy import ChromAnalyzer
 
 
-def test_windows():
-    path = "docs/examples/data/agilent_rdl"
-
-    # print path and all files in the directory
-    print(path)
-    print(os.listdir(path))
-
-    # Create a ChromAnalyzer object
-    ana = ChromAnalyzer.read_agilent(
-        path=path,
+@pytest.fixture(scope="session")
+def agilent_analyzer():
+    return ChromAnalyzer.read_agilent(
+        path="docs/examples/data/agilent_rdl",
         ph=7.0,
         temperature=25.0,
         mode="timecourse",
     )
 
-    assert len(ana.measurements) == 2
+
+def test_windows(agilent_analyzer):
+    assert len(agilent_analyzer.measurements) == 2
@@ -0,0 +1,41 @@
+import numpy as np
+
+from chromatopy.model import Chromatogram, Peak
+from chromatopy.tools.utility import pick_peak
+
+
+def _chromatogram(retention_times: list[float]) -> Chromatogram:
+    return Chromatogram(
+        peaks=[Peak(retention_time=rt, area=1.0) for rt in retention_times]
+    )
+
+
+def _pick_peak_loop(chromatograms, retention_time, tolerance):
+    current_retention = retention_time
+    peaks = []
+    for chrom in chromatograms:
+        for peak in chrom.peaks:
+            if abs(peak.retention_time - current_retention) < tolerance:
+                peaks.append(peak)
+                current_retention = peak.retention_time
+    return peaks
+
+
+def test_pick_peak_follows_drifting_retention_times():
+    chromatograms = [_chromatogram([1.0, 1.08, 1.16, 2.0]), _chromatogram([1.24])]
+
+    peaks = pick_peak(chromatograms, retention_time=1.0, tolerance=0.1)
+
+    assert [peak.retention_time for peak in peaks] == [1.0, 1.08, 1.16, 1.24]
+
+
+def test_pick_peak_matches_sequential_scan():
+    rng = np.random.default_rng(0)
+    chromatograms = [
+        _chromatogram(rng.uniform(0.0, 5.0, 30).round(2).tolist()) for _ in range(20)
+    ]
+
+    for retention_time in [0.5, 1.0, 2.5, 4.9]:
+        assert pick_peak(chromatograms, retention_time, 0.15) == _pick_peak_loop(
+            chromatograms, retention_time, 0.15
+        )
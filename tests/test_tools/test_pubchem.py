@@ -0,0 +1,76 @@
+import httpx
+import pytest
+
+from chromatopy import ChromAnalyzer
+from chromatopy.tools import utility
+
+# returned by PubChem for single lookups only
+MISSING_CID = 7
+
+
+def _pubchem_handler(requests: list[list[int]]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        cids = [int(cid) for cid in request.url.path.split("/")[5].split(",")]
+        requests.append(cids)
+        properties = [
+            {"CID": cid, "Title": f"molecule {cid}"}
+            for cid in cids
+            if cid != MISSING_CID or len(cids) == 1
+        ]
+        return httpx.Response(200, json={"PropertyTable": {"Properties": properties}})
+
+    return handler
+
+
+def _patch_transport(monkeypatch, handler) -> None:
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(httpx, "get", client.get)
+
+
+def test_names_are_requested_in_batches(monkeypatch):
+    requests = []
+    _patch_transport(monkeypatch, _pubchem_handler(requests))
+
+    cids = list(range(1, 451))
+    names = utility.pubchem_molecule_names(cids + [1, 2])
+
+    assert [len(batch) for batch in requests] == [200, 200, 50]
+    assert MISSING_CID not in names
+    assert len(names) == 449
+    assert names[450] == "molecule 450"
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        httpx.Response(503),
+        httpx.Response(200, json={"Fault": {"Code": "PUGREST.NotFound"}}),
+        httpx.Response(200, content=b"<html></html>"),
+    ],
+)
+def test_failed_batch_raises_value_error(monkeypatch, response):
+    _patch_transport(monkeypatch, lambda request: response)
+
+    with pytest.raises(ValueError):
+        utility.pubchem_molecule_names([1, 2])
+
+
+def test_define_molecules_falls_back_to_single_lookup(monkeypatch):
+    requests = []
+    _patch_transport(monkeypatch, _pubchem_handler(requests))
+    utility.pubchem_molecule_name.cache_clear()
+
+    analyzer = ChromAnalyzer(id="pubchem", name="pubchem", mode="timecourse")
+    molecules = analyzer.define_molecules(
+        [
+            {"id": f"s{cid}", "pubchem_cid": cid, "retention_time": None}
+            for cid in range(1, 251)
+        ]
+    )
+
+    assert [len(batch) for batch in requests] == [200, 50, 1]
+    assert [molecule.name for molecule in molecules[5:8]] == [
+        "molecule 6",
+        "molecule 7",
+        "molecule 8",
+    ]
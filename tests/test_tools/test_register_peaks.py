@@ -0,0 +1,88 @@
+import pytest
+
+from chromatopy import ChromAnalyzer
+from chromatopy.model import Chromatogram, Data, Measurement, Peak
+from chromatopy.tools.molecule import Molecule
+from chromatopy.units import C, minute
+
+# molecule retention time, tolerance and peaks at and around the window bounds
+WINDOWS = [
+    (4.1, 0.1, [3.9, 4.0, 4.1, 4.2, 4.3]),
+    (0.7, 0.2, [0.5, 0.6, 0.9]),
+    (2.3, 0.3, [2.0, 2.3, 2.6]),
+]
+
+
+def _analyzer(retention_times: list[float]) -> ChromAnalyzer:
+    measurement = Measurement(
+        id="m0",
+        data=Data(value=0.0, unit=minute, data_type="timecourse"),
+        temperature=25.0,
+        temperature_unit=C,
+        ph=7.0,
+        chromatograms=[
+            Chromatogram(
+                peaks=[Peak(retention_time=rt, area=1.0) for rt in retention_times]
+            )
+        ],
+    )
+    return ChromAnalyzer(
+        id="peaks", name="peaks", mode="timecourse", measurements=[measurement]
+    )
+
+
+def _assigned(analyzer: ChromAnalyzer) -> list[float]:
+    peaks = analyzer.measurements[0].chromatograms[0].peaks
+    return [peak.retention_time for peak in peaks if peak.molecule_id is not None]
+
+
+def _expected(retention_time, tolerance, retention_times) -> list[float]:
+    return [
+        rt for rt in retention_times if rt - tolerance < retention_time < rt + tolerance
+    ]
+
+
+@pytest.mark.parametrize("retention_time, tolerance, retention_times", WINDOWS)
+def test_register_peaks_excludes_window_bounds(
+    retention_time, tolerance, retention_times
+):
+    analyzer = _analyzer(retention_times)
+    analyzer.define_molecule(
+        id="s0",
+        pubchem_cid=1,
+        name="molecule",
+        retention_time=retention_time,
+        retention_tolerance=tolerance,
+    )
+
+    assert _assigned(analyzer) == _expected(retention_time, tolerance, retention_times)
+
+
+@pytest.mark.parametrize("retention_time, tolerance, retention_times", WINDOWS)
+def test_register_molecules_peaks_excludes_window_bounds(
+    retention_time, tolerance, retention_times
+):
+    analyzer = _analyzer(retention_times)
+    molecule = Molecule(
+        id="s0",
+        pubchem_cid=1,
+        name="molecule",
+        retention_time=retention_time,
+        retention_tolerance=tolerance,
+    )
+    analyzer._register_molecules_peaks([molecule])
+
+    assert _assigned(analyzer) == _expected(retention_time, tolerance, retention_times)
+
+
+def test_peak_at_lower_bound_is_not_assigned():
+    analyzer = _analyzer([4.0, 4.1])
+    analyzer.define_molecule(
+        id="s0",
+        pubchem_cid=1,
+        name="molecule",
+        retention_time=4.1,
+        retention_tolerance=0.1,
+    )
+
+    assert _assigned(analyzer) == [4.1]
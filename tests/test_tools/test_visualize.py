@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from chromatopy import ChromAnalyzer
+from chromatopy.model import Chromatogram, Data, Measurement
+from chromatopy.units import C, minute
+
+N_POINTS = 6000
+
+
+@pytest.fixture(scope="module")
+def long_analyzer():
+    times = np.linspace(0.0, 10.0, N_POINTS)
+    signals = np.exp(-((times - 5.0) ** 2) / 0.1)
+    measurements = [
+        Measurement(
+            id=f"m{idx}",
+            data=Data(value=float(idx), unit=minute, data_type="timecourse"),
+            temperature=25.0,
+            temperature_unit=C,
+            ph=7.0,
+            chromatograms=[
+                Chromatogram(times=times.tolist(), signals=signals.tolist())
+            ],
+        )
+        for idx in range(2)
+    ]
+    return ChromAnalyzer(
+        id="long", name="long", mode="timecourse", measurements=measurements
+    )
+
+
+def test_visualize_all_downsamples_long_signal(long_analyzer):
+    fig = long_analyzer.visualize_all()
+
+    signal = fig.data[0]
+    assert signal.type == "scatter"
+    assert len(signal.x) == 2000
+
+
+def test_visualize_all_draws_full_long_signal_as_webgl(long_analyzer):
+    fig = long_analyzer.visualize_all(max_points=None)
+
+    signal = fig.data[0]
+    assert signal.type == "scattergl"
+    assert len(signal.x) == N_POINTS
+
+
+def test_visualize_spectra_downsamples_long_signal(long_analyzer):
+    fig = long_analyzer.visualize_spectra()
+
+    signal = fig.data[0]
+    assert signal.type == "scatter"
+    assert len(signal.x) == 2000
+
+
+def test_visualize_spectra_draws_full_long_signal_as_webgl(long_analyzer):
+    fig = long_analyzer.visualize_spectra(max_points=None)
+
+    signal = fig.data[0]
+    assert signal.type == "scattergl"
+    assert len(signal.x) == N_POINTS
@@ -0,0 +1,37 @@
+import pytest
+
+from chromatopy.units import M, min, mM, s
+from chromatopy.units.predefined import Unit
+from chromatopy.units.units import _TRUEDIV_DISPATCH, Prefix, k
+
+
+def test_division_leaves_operands_untouched():
+    rate = mM / s
+    inverse = 1 / min
+
+    assert str(rate) == "mmol / l s"
+    assert str(inverse) == "1 / s"
+    assert str(mM) == "mmol / l"
+    assert str(s) == "s"
+    assert str(min) == "s"
+    assert min.base_units[0].exponent == 1
+
+
+def test_multiplication_leaves_operands_untouched():
+    scaled = M * 2
+
+    assert scaled.base_units[0].multiplier == 2
+    assert all(base.multiplier is None for base in M.base_units)
+    assert str(M) == "mol / l"
+
+
+def test_unsupported_operand_is_not_cached():
+    with pytest.raises(TypeError):
+        Unit.second() / "s"
+
+    assert str not in _TRUEDIV_DISPATCH
+
+
+def test_prefixes_are_class_attributes():
+    assert Prefix.k is k
+    assert (Prefix.m * Unit.mol()).scale == -3